@@ -0,0 +1,78 @@
+"""
+Benchmark de entradas patológicas para markdown_to_unicode.
+
+Cada padrão do corpus adversarial (delimitadores sem par, aninhamento
+profundo, links e código inline sem fechamento) é repetido em um único
+parágrafo de tamanho crescente. Para cada tamanho, relata o tempo por
+caractere e a razão em relação ao menor tamanho: em uma conversão linear a
+razão fica perto de 1, enquanto um comportamento quadrático a faz crescer
+junto com a entrada.
+
+Exemplos:
+    python benchmarks/bench_adversarial.py
+    python benchmarks/bench_adversarial.py --sizes 10K,100K,1M --patterns stars,brackets
+    python benchmarks/bench_adversarial.py --variants md2unicode,code3 --sizes 1K,4K,16K
+"""
+
+import argparse
+import sys
+from typing import Callable, Dict, Optional, Sequence
+
+from bench_converter import _format_size, load_variants, measure, parse_size
+
+# Cada padrão é repetido até atingir o tamanho pedido
+_PATTERNS: Dict[str, str] = {
+    'stars': '* ',                  # '*' sem par
+    'double-stars': '**a ',         # '**' sem par
+    'underscores': '_a ',           # '_' sem par
+    'tildes': '~~a ',               # '~~' sem par
+    'brackets': '[a ',              # '[' sem fechamento
+    'link-open': '[a](b ',          # link sem ')' final
+    'backticks': '\\`a `',          # crases escapadas e soltas
+    'nesting': '*_*_',              # alternância que nunca fecha
+    'mixed-runs': '**a*',           # sequências de tamanhos diferentes
+    'tilde-runs': '~~a~',
+    'spent-tildes': '~~~a *a* ',    # aberturas '~' esgotadas seguidas de spans simples
+}
+
+
+def generate_adversarial(pattern: str, size: int) -> str:
+    """Gera um parágrafo de aproximadamente `size` caracteres repetindo o padrão."""
+    unit = _PATTERNS[pattern]
+    return 'x ' + unit * max(size // len(unit), 1)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--sizes', default='10K,100K,1M', help='tamanhos dos parágrafos, ex.: 1K,10K,100K')
+    parser.add_argument('--patterns', default=','.join(_PATTERNS),
+                        help=f"padrões adversariais ({', '.join(_PATTERNS)})")
+    parser.add_argument('--variants', default='md2unicode',
+                        help='variantes a comparar (md2unicode, code3, code4); as antigas podem ser '
+                             'quadráticas, use tamanhos pequenos')
+    parser.add_argument('--repeat', type=int, default=3, help='execuções mínimas por caso')
+    parser.add_argument('--min-time', type=float, default=0.2, help='tempo mínimo (s) por caso')
+    args = parser.parse_args(argv)
+
+    variants: Dict[str, Callable[[str], str]] = load_variants([name for name in args.variants.split(',') if name])
+    sizes = [parse_size(item) for item in args.sizes.split(',')]
+
+    header = f"{'variante':<11} {'padrão':<13} {'tamanho':>8} {'ms':>10} {'ns/char':>9} {'razão':>7}"
+    print(header)
+    print('-' * len(header))
+    for pattern in args.patterns.split(','):
+        for name, convert in variants.items():
+            baseline = None
+            for size in sizes:
+                text = generate_adversarial(pattern, size)
+                elapsed = min(measure(convert, text, args.repeat, args.min_time))
+                per_char = elapsed / len(text) * 1e9
+                if baseline is None:
+                    baseline = per_char
+                print(f"{name:<11} {pattern:<13} {_format_size(size):>8} {elapsed * 1000:>10.2f} "
+                      f"{per_char:>9.1f} {per_char / baseline:>7.2f}", flush=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,250 @@
+"""
+Benchmark de markdown_to_unicode sobre corpora gerados.
+
+Varia tamanho, densidade de marcação, comprimento de linha e mistura de
+elementos de bloco, e compara o pacote md2unicode com as variantes antigas
+"code (3).py" e "code (4).py". Para cada caso, relata vazão, percentis de
+latência e (com --memory) o pico de memória alocada.
+
+Exemplos:
+    python benchmarks/bench_converter.py
+    python benchmarks/bench_converter.py --sizes 1K,1M --densities plain,heavy --memory
+    python benchmarks/bench_converter.py --sizes 10M,50M --variants md2unicode --repeat 3
+"""
+
+import argparse
+import ast
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Sequence
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+Convert = Callable[[str], str]
+
+_WORDS = (
+    "concreto armadura barra estrutura projeto norma ensaio carga tensão ponte "
+    "obra material aço vidro resina fibra durabilidade corrosão ambiente marinho "
+    "the quick brown fox jumps over lazy dog lorem ipsum dolor sit amet 2025 42"
+).split()
+
+# Probabilidade de uma palavra receber marcação inline, por densidade
+_DENSITIES = {'plain': 0.0, 'light': 0.05, 'heavy': 0.5}
+
+# Pesos de (texto, lista, citação, cabeçalho, linha horizontal, linha em branco,
+# bloco de código cercado)
+_BLOCK_MIXES = {
+    'prose': (80, 0, 0, 2, 0, 18, 0),
+    'lists': (30, 50, 0, 5, 0, 15, 0),
+    'quotes': (30, 0, 50, 5, 0, 15, 0),
+    'mixed': (45, 20, 10, 8, 2, 15, 0),
+    'code': (25, 5, 0, 5, 0, 15, 50),
+}
+
+_INLINE_WRAPPERS = (
+    ('**', '**'), ('__', '__'), ('*', '*'), ('_', '_'), ('`', '`'), ('~~', '~~'),
+    ('[', '](https://example.com)'), ('**_', '_**'),
+)
+
+
+def parse_size(text: str) -> int:
+    """Converte '1K', '10M', '50M' ou '2048' em bytes."""
+    text = text.strip().upper()
+    multiplier = 1
+    if text[-1:] in ('K', 'M', 'G'):
+        multiplier = {'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}[text[-1]]
+        text = text[:-1]
+    return int(float(text) * multiplier)
+
+
+def generate_corpus(size: int, density: str = 'light', line_length: int = 80,
+                    block_mix: str = 'mixed', seed: int = 0) -> str:
+    """Gera um documento Markdown determinístico com aproximadamente `size` caracteres."""
+    rng = random.Random(seed)
+    probability = _DENSITIES[density]
+    kinds = ('text', 'list', 'quote', 'header', 'rule', 'blank', 'code')
+    weights = _BLOCK_MIXES[block_mix]
+    lines: List[str] = []
+    total = 0
+    while total < size:
+        kind = rng.choices(kinds, weights)[0]
+        if kind == 'blank':
+            line = ''
+        elif kind == 'rule':
+            line = '---'
+        elif kind == 'code':
+            # Código cheio de '*' e '_', que não deve receber estilos inline
+            code = [f"    {rng.choice(_WORDS)}_{rng.choice(_WORDS)} = {rng.choice(_WORDS)} * args[{length}]"
+                    for length in range(rng.randint(3, 12))]
+            line = '\n'.join(['```python', *code, '```'])
+        else:
+            words: List[str] = []
+            length = 0
+            while length < line_length:
+                word = rng.choice(_WORDS)
+                if probability and rng.random() < probability:
+                    opening, closing = rng.choice(_INLINE_WRAPPERS)
+                    word = f"{opening}{word}{closing}"
+                words.append(word)
+                length += len(word) + 1
+            line = ' '.join(words)
+            if kind == 'list':
+                line = f"{rng.choice('-*+')} {line}"
+            elif kind == 'quote':
+                line = f"> {line}"
+            elif kind == 'header':
+                line = f"{'#' * rng.randint(1, 3)} {line[:40]}"
+        lines.append(line)
+        total += len(line) + 1
+    return '\n'.join(lines)
+
+
+def _load_script_variant(path: str) -> Convert:
+    """
+    Extrai markdown_to_unicode de um script Streamlit antigo sem executar a
+    interface: mantém só imports, funções e constantes privadas (`_NOME = ...`)
+    que não usam `st`.
+    """
+    with open(path, encoding='utf-8') as handle:
+        tree = ast.parse(handle.read(), filename=path)
+
+    def uses_ui(node: ast.AST) -> bool:
+        for child in ast.walk(node):
+            if isinstance(child, ast.Name) and child.id in ('st', 'pyperclip'):
+                return True
+            if isinstance(child, ast.alias) and child.name.split('.')[0] in ('streamlit', 'pyperclip'):
+                return True
+        return False
+
+    def is_private_constant(node: ast.AST) -> bool:
+        targets = node.targets if isinstance(node, ast.Assign) else [getattr(node, 'target', None)]
+        return all(isinstance(target, ast.Name) and target.id.startswith('_') for target in targets)
+
+    body = [node for node in tree.body
+            if (isinstance(node, (ast.Import, ast.ImportFrom, ast.FunctionDef))
+                or (isinstance(node, (ast.Assign, ast.AnnAssign)) and is_private_constant(node)))
+            and not uses_ui(node)]
+    namespace: Dict[str, object] = {'__name__': os.path.basename(path)}
+    exec(compile(ast.Module(body=body, type_ignores=[]), path, 'exec'), namespace)
+    return namespace['markdown_to_unicode']  # type: ignore[return-value]
+
+
+def load_variants(names: Sequence[str]) -> Dict[str, Convert]:
+    """Carrega as variantes pedidas ('md2unicode', 'code3', 'code4')."""
+    variants: Dict[str, Convert] = {}
+    for name in names:
+        if name == 'md2unicode':
+            from md2unicode import markdown_to_unicode
+            variants[name] = markdown_to_unicode
+        elif name == 'code3':
+            variants[name] = _load_script_variant(os.path.join(ROOT, 'code (3).py'))
+        elif name == 'code4':
+            variants[name] = _load_script_variant(os.path.join(ROOT, 'code (4).py'))
+        else:
+            raise SystemExit(f"variante desconhecida: {name}")
+    return variants
+
+
+def _percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def measure(convert: Convert, text: str, repeat: int, min_time: float) -> List[float]:
+    """Executa a conversão pelo menos `repeat` vezes (e por `min_time` segundos)."""
+    samples: List[float] = []
+    started = time.perf_counter()
+    while len(samples) < repeat or time.perf_counter() - started < min_time:
+        begin = time.perf_counter()
+        convert(text)
+        samples.append(time.perf_counter() - begin)
+        if len(samples) >= 10000:
+            break
+    return samples
+
+
+def peak_memory(convert: Convert, text: str) -> int:
+    """Pico de memória alocada (bytes) durante uma conversão, via tracemalloc."""
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        convert(text)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def import_time(module: str, runs: int = 5) -> float:
+    """Tempo médio (s) de `import module` em um interpretador novo, descontado o `pass`."""
+    def run(code: str) -> float:
+        timings = []
+        for _ in range(runs):
+            begin = time.perf_counter()
+            subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True)
+            timings.append(time.perf_counter() - begin)
+        return min(timings)
+    return max(0.0, run(f'import {module}') - run('pass'))
+
+
+def _format_size(size: int) -> str:
+    for unit, factor in (('M', 1024 ** 2), ('K', 1024)):
+        if size >= factor:
+            return f"{size / factor:g}{unit}"
+    return str(size)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--sizes', default='1K,10K,100K,1M',
+                        help='tamanhos dos corpora, ex.: 1K,100K,1M,10M,50M')
+    parser.add_argument('--densities', default='plain,light,heavy',
+                        help=f"densidades de marcação ({', '.join(_DENSITIES)})")
+    parser.add_argument('--line-lengths', default='80', help='comprimentos de linha, ex.: 40,80,400')
+    parser.add_argument('--block-mixes', default='mixed', help=f"misturas de blocos ({', '.join(_BLOCK_MIXES)})")
+    parser.add_argument('--variants', default='md2unicode,code3,code4',
+                        help='variantes a comparar (md2unicode, code3, code4)')
+    parser.add_argument('--repeat', type=int, default=5, help='execuções mínimas por caso')
+    parser.add_argument('--min-time', type=float, default=0.5, help='tempo mínimo (s) por caso')
+    parser.add_argument('--memory', action='store_true', help='mede o pico de memória (mais lento)')
+    parser.add_argument('--import-time', action='store_true', help='mede o tempo de importação de md2unicode')
+    args = parser.parse_args(argv)
+
+    variants = load_variants([name for name in args.variants.split(',') if name])
+    if args.import_time:
+        print(f"import md2unicode: {import_time('md2unicode') * 1000:.1f} ms")
+
+    header = (f"{'variante':<11} {'tamanho':>8} {'densidade':<9} {'linha':>5} {'blocos':<7} "
+              f"{'MB/s':>8} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9}")
+    if args.memory:
+        header += f" {'pico MB':>8}"
+    print(header)
+    print('-' * len(header))
+
+    for size in (parse_size(item) for item in args.sizes.split(',')):
+        for density in args.densities.split(','):
+            for line_length in (int(item) for item in args.line_lengths.split(',')):
+                for block_mix in args.block_mixes.split(','):
+                    text = generate_corpus(size, density, line_length, block_mix)
+                    megabytes = len(text.encode('utf-8')) / 1e6
+                    for name, convert in variants.items():
+                        samples = measure(convert, text, args.repeat, args.min_time)
+                        row = (f"{name:<11} {_format_size(size):>8} {density:<9} {line_length:>5} {block_mix:<7} "
+                               f"{megabytes / statistics.median(samples):>8.2f} "
+                               f"{_percentile(samples, 0.5) * 1000:>9.3f} "
+                               f"{_percentile(samples, 0.9) * 1000:>9.3f} "
+                               f"{_percentile(samples, 0.99) * 1000:>9.3f}")
+                        if args.memory:
+                            row += f" {peak_memory(convert, text) / 1e6:>8.1f}"
+                        print(row, flush=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
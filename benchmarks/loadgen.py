@@ -0,0 +1,97 @@
+"""
+Gerador de carga para o serviço HTTP (md2unicode.service).
+
+Abre `--concurrency` conexões persistentes e envia POST /convert com
+documentos gerados por bench_converter.generate_corpus durante `--duration`
+segundos. Relata requisições por segundo, percentis de latência e as
+respostas de erro (por exemplo, 503 quando o serviço aplica backpressure).
+
+Exemplos:
+    python -m md2unicode.service --port 8080 &
+    python benchmarks/loadgen.py --url http://127.0.0.1:8080 --concurrency 64 --sizes 1K
+    python benchmarks/loadgen.py --concurrency 8 --sizes 1K,1M --duration 20
+"""
+
+import argparse
+import asyncio
+import collections
+import json
+import sys
+import time
+from typing import Counter, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+from bench_converter import _percentile, generate_corpus, parse_size
+
+
+async def _post(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, host: str,
+                body: bytes) -> Tuple[int, bytes]:
+    """Envia um POST /convert na conexão aberta e lê a resposta completa."""
+    writer.write((f"POST /convert HTTP/1.1\r\nHost: {host}\r\n"
+                  f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n").encode('latin-1') + body)
+    await writer.drain()
+    head = (await reader.readuntil(b'\r\n\r\n')).decode('latin-1').split('\r\n')
+    status = int(head[0].split(' ', 2)[1])
+    length = 0
+    for line in head[1:]:
+        if line.lower().startswith('content-length:'):
+            length = int(line.split(':', 1)[1])
+    return status, await reader.readexactly(length)
+
+
+async def _client(host: str, port: int, bodies: List[bytes], offset: int, deadline: float,
+                  latencies: List[float], statuses: Counter[int]) -> None:
+    reader, writer = await asyncio.open_connection(host, port)
+    index = offset
+    try:
+        while time.perf_counter() < deadline:
+            body = bodies[index % len(bodies)]
+            index += 1
+            start = time.perf_counter()
+            status, _ = await _post(reader, writer, host, body)
+            latencies.append(time.perf_counter() - start)
+            statuses[status] += 1
+            if status == 503:
+                await asyncio.sleep(0.01)
+    finally:
+        writer.close()
+
+
+async def run(url: str, concurrency: int, duration: float, sizes: Sequence[int], density: str) -> int:
+    parts = urlsplit(url)
+    host, port = parts.hostname or '127.0.0.1', parts.port or 80
+    bodies = [json.dumps({'text': generate_corpus(size, density, seed=seed)}).encode('utf-8')
+              for size in sizes for seed in range(4)]
+    latencies: List[float] = []
+    statuses: Counter[int] = collections.Counter()
+    start = time.perf_counter()
+    deadline = start + duration
+    await asyncio.gather(*(_client(host, port, bodies, offset, deadline, latencies, statuses)
+                           for offset in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    print(f"requisições: {len(latencies)} em {elapsed:.1f} s ({len(latencies) / elapsed:.0f} req/s)")
+    print("status: " + ', '.join(f"{status}={count}" for status, count in sorted(statuses.items())))
+    if latencies:
+        latencies.sort()
+        print(f"latência ms: p50={_percentile(latencies, 0.5) * 1000:.2f} "
+              f"p90={_percentile(latencies, 0.9) * 1000:.2f} "
+              f"p99={_percentile(latencies, 0.99) * 1000:.2f} "
+              f"máx={latencies[-1] * 1000:.2f}")
+    return 0 if statuses.get(200) else 1
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--url', default='http://127.0.0.1:8080', help='endereço do serviço')
+    parser.add_argument('--concurrency', type=int, default=32, help='conexões simultâneas')
+    parser.add_argument('--duration', type=float, default=10.0, help='duração do teste (s)')
+    parser.add_argument('--sizes', default='1K', help='tamanhos dos documentos, ex.: 1K,100K,1M')
+    parser.add_argument('--density', default='light', help='densidade de marcação (plain, light, heavy)')
+    args = parser.parse_args(argv)
+    return asyncio.run(run(args.url, args.concurrency, args.duration,
+                           [parse_size(item) for item in args.sizes.split(',')], args.density))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
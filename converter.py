@@ -1,208 +1,39 @@
 # app.py
 
-import streamlit as st
-import re
-from typing import Optional, Dict, Any, List
-
-# Tenta importar pyperclip e lida com a ausência
-try:
-    import pyperclip
-    HAS_PYPERCLIP = True
-except ImportError:
-    HAS_PYPERCLIP = False
-    st.warning("A biblioteca `pyperclip` não está instalada.  O botão 'Copiar Texto' não funcionará. Instale com `pip install pyperclip`.", icon="⚠️")
-
-
-# --- Cole o código da função markdown_to_unicode AQUI ---
-# Incluindo mapeamentos, funções auxiliares e a função principal
-# Você pode copiar e colar o código completo do script anterior aqui.
-
-# --- Mapeamentos Unicode para Estilos ---
-_BOLD_MAP = {
-    'A': '𝐀', 'B': '𝐁', 'C': '𝐂', 'D': '𝐃', 'E': '𝐄', 'F': '𝐅', 'G': '𝐆', 'H': '𝐇', 'I': '𝐈', 'J': '𝐉', 'K': '𝐊', 'L': '𝐋', 'M': '𝐌', 'N': '𝐍', 'O': '𝐎', 'P': '𝐏', 'Q': '𝐐', 'R': '𝐑', 'S': '𝐒', 'T': '𝐓', 'U': '𝐔', 'V': '𝐕', 'W': '𝐖', 'X': '𝐗', 'Y': '𝐘', 'Z': '𝐙',
-    'a': '𝐚', 'b': '𝐛', 'c': '𝐜', 'd': '𝐝', 'e': '𝐞', 'f': '𝐟', 'g': '𝐠', 'h': '𝐡', 'i': '𝐢', 'j': '𝐣', 'k': '𝐤', 'l': '𝐥', 'm': '𝐦', 'n': '𝐧', 'o': '𝐨', 'p': '𝐩', 'q': '𝐪', 'r': '𝐫', 's': '𝐬', 't': '𝐭', 'u': '𝐮', 'v': '𝐯', 'w': '𝐰', 'x': '𝐱', 'y': '𝐲', 'z': '𝐳',
-    '0': '𝟎', '1': '𝟏', '2': '𝟐', '3': '𝟑', '4': '𝟒', '5': '𝟓', '6': '𝟔', '7': '𝟕', '8': '𝟖', '9': '𝟗',
-}
-
-_ITALIC_MAP = {
-    'A': '𝘈', 'B': '𝘉', 'C': '𝘊', 'D': '𝘋', 'E': '𝘌', 'F': '𝘍', 'G': '𝘎', 'H': '𝘏', 'I': '𝘐', 'J': '𝘑', 'K': '𝘒', 'L': '𝘓', 'M': '𝘔', 'N': '𝘕', 'O': '𝘖', 'P': '𝘗', 'Q': '𝘘', 'R': '𝘙', 'S': '𝘚', 'T': '𝘛', 'U': '𝘜', 'V': '𝘝', 'W': '𝘞', 'X': '𝘟', 'Y': '𝘠', 'Z': '𝘡',
-    'a': '𝘢', 'b': '𝘣', 'c': '𝘤', 'd': '𝘥', 'e': '𝘦', 'f': '𝘧', 'g': '𝘨', 'h': '𝘩', 'i': '𝘪', 'j': '𝘫', 'k': '𝘬', 'l': '𝘭', 'm': '𝘮', 'n': '𝘯', 'o': '𝘰', 'p': '𝘱', 'q': '𝘲', 'r': '𝘳', 's': '𝘴', 't': '𝘵', 'u': '𝘶', 'v': '𝘷', 'w': '𝘸', 'x': '𝘹', 'y': '𝘺', 'z': '𝘻',
-}
-
-_MONOSPACE_MAP = {
-    'A': '𝙰', 'B': '𝙱', 'C': '𝙲', 'D': '𝙳', 'E': '𝙴', 'F': '𝙵', 'G': '𝙶', 'H': '𝙷', 'I': '𝙸', 'J': '𝙹', 'K': '𝙺', 'L': '𝙻', 'M': '𝙼', 'N': '𝙽', 'O': '𝙾', 'P': '𝙿', 'Q': '𝚀', 'R': '𝚁', 'S': '𝚂', 'T': '𝚃', 'U': '𝚄', 'V': '𝚅', 'W': '𝚆', 'X': '𝚇', 'Y': '𝚈', 'Z': '𝚺',
-    'a': '𝚊', 'b': '𝚋', 'c': '𝚌', 'd': '𝚍', 'e': '𝚎', 'f': '𝚏', 'g': '𝚐', 'h': '𝚑', 'i': '𝚒', 'j': '𝚓', 'k': '𝚔', 'l': '𝚕', 'm': '𝚖', 'n': '𝚗', 'o': '𝚘', 'p': '𝚙', 'q': '𝚚', 'r': '𝚛', 's': '𝚜', 't': '𝚝', 'u': '𝚞', 'v': '𝚟', 'w': '𝚠', 'x': '𝚡', 'y': '𝚢', 'z': '𝚣',
-    '0': '𝟶', '1': '𝟷', '2': '𝟸', '3': '𝟹', '4': '𝟺', '5': '𝟻', '6': '𝟼', '7': '𝟽', '8': '𝟾', '9': '𝟿',
-}
-
-_STRIKETHROUGH_CHAR = '\u0336' # Combining Long Stroke Overlay
-
-# --- Funções Auxiliares para Aplicar Estilos ---
-def _apply_mapping(text: str, mapping: Dict[str, str]) -> str:
-    """Aplica um mapeamento de caracteres a uma string."""
-    return "".join(mapping.get(char, char) for char in text)
-
-def _to_bold(text: str) -> str:
-    """Converte texto para Unicode Bold."""
-    return _apply_mapping(text, _BOLD_MAP)
-
-def _to_italic(text: str) -> str:
-    """Converte texto para Unicode Italic."""
-    return _apply_mapping(text, _ITALIC_MAP)
-
-def _to_monospace(text: str) -> str:
-    """Converte texto para Unicode Monospace."""
-    return _apply_mapping(text, _MONOSPACE_MAP)
+import io
+import json
+import os
 
-def _to_strikethrough(text: str) -> str:
-    """Aplica o caractere de Strikethrough a cada caractere."""
-    return "".join(char + _STRIKETHROUGH_CHAR for char in text)
-
-# --- Funções de Substituição para Regex ---
-def _code_replacer(match: re.Match) -> str:
-    """Substitui `code` por texto monospace."""
-    return _to_monospace(match.group(1))
-
-def _strikethrough_replacer(match: re.Match) -> str:
-    """Substitui ~~strikethrough~~ por texto riscado."""
-    return _to_strikethrough(match.group(1))
-
-def _bold_replacer_star(match: re.Match) -> str:
-    """Substitui **bold** por texto bold Unicode."""
-    return _to_bold(match.group(1))
-
-def _bold_replacer_underscore(match: re.Match) -> str:
-    """Substitui __bold__ por texto bold Unicode."""
-    return _to_bold(match.group(1))
-
-def _italic_replacer_star(match: re.Match) -> str:
-    """Substitui *italic* por texto italic Unicode."""
-    return _to_italic(match.group(1))
-
-def _italic_replacer_underscore(match: re.Match) -> str:
-    """Substitui _italic_ por texto italic Unicode."""
-    return _to_italic(match.group(1))
+import streamlit as st
+import streamlit.components.v1 as components
+
+from md2unicode import (
+    ConversionBudget,
+    ConversionCache,
+    ConversionTimeoutError,
+    Converter,
+    IncrementalConverter,
+    convert_to_sink_with_limits,
+)
+from md2unicode.core import _MAX_HORIZONTAL_RULE_CHARS, _MAX_OPTION_CHARS
 
-def _link_replacer(match: re.Match) -> str:
-    """Substitui [text](url) por text."""
-    return match.group(1)
+# Limites para textos colados por qualquer visitante do app público
+MAX_INPUT_CHARS = 200_000
+TIME_BUDGET_SECONDS = 2.0
 
-# --- Função Principal ---
-def markdown_to_unicode(markdown_text: str, options: Optional[Dict[str, Any]] = None) -> str:
-    """
-    Converte uma string Markdown básica para uma string usando caracteres Unicode estilizados.
+# Modo de envio de arquivo: tamanho máximo aceito (o limite do próprio
+# Streamlit, server.maxUploadSize, também precisa comportá-lo)
+MAX_UPLOAD_BYTES = int(os.environ.get('MD2UNICODE_MAX_UPLOAD_BYTES', 50 * 1024 * 1024))
+# Prazo da conversão de um arquivo enviado; depois dele, o restante do arquivo
+# sai só com os elementos de bloco, como no modo de colar texto
+UPLOAD_TIME_BUDGET_SECONDS = float(os.environ.get('MD2UNICODE_UPLOAD_TIME_BUDGET', 60.0))
 
-    Args:
-        markdown_text: A string contendo Markdown.
-        options: Um dicionário opcional para configurar a conversão.
-                 Opções suportadas:
-                 - 'list_bullet' (str): O caractere a usar para itens de lista não ordenada (padrão: '•').
-                 - 'header_style' (str): Estilo para cabeçalhos ('strip' para remover #, 'bold' para aplicar bold, padrão: 'strip').
-                 - 'horizontal_rule_char' (str): O caractere a usar para a linha horizontal (padrão: '─').
-                 - 'horizontal_rule_length' (int): O comprimento da linha horizontal (padrão: 20).
 
-
-    Returns:
-        A string convertida com caracteres Unicode.
-    """
-    if not isinstance(markdown_text, str):
-        # Em um app web, talvez seja melhor retornar string vazia ou mensagem de erro
-        # mas manter a validação ajuda durante o desenvolvimento.
-        # return ""
-        raise TypeError("Input must be a string.")
-
-    # 1. Configurar Opções
-    effective_options: Dict[str, Any] = {
-        'list_bullet': '•',
-        'header_style': 'strip', # 'strip' ou 'bold'
-        'horizontal_rule_char': '─', # Caractere para HR
-        'horizontal_rule_length': 20, # Comprimento padrão da HR
-    }
-    if options:
-        # Validação básica para garantir que as opções passadas são válidas
-        for key, value in options.items():
-            if key in effective_options:
-                 # Adiciona validação de tipo se necessário
-                 if key == 'list_bullet' and not isinstance(value, str): continue
-                 if key == 'header_style' and value not in ['strip', 'bold']: continue
-                 if key == 'horizontal_rule_char' and not isinstance(value, str): continue
-                 if key == 'horizontal_rule_length' and not isinstance(value, int): continue
-                 # Se a validação passar (ou não houver validação específica), atualiza
-                 effective_options[key] = value
-
-
-    list_bullet = effective_options['list_bullet']
-    header_style = effective_options['header_style']
-    hr_char = effective_options['horizontal_rule_char']
-    hr_length = effective_options['horizontal_rule_length']
-
-    processed_lines: List[str] = []
-
-    # 2. Processar elementos de nível de bloco (linha por linha)
-    lines = markdown_text.splitlines()
-
-    for line in lines:
-        # Horizontal Rule (deve ser verificado primeiro, pois consome a linha inteira)
-        if re.fullmatch(r'\s*([-*_])(\s*\1){2,}\s*', line):
-             processed_lines.append(hr_char * hr_length)
-             continue
-
-        # Blockquote
-        blockquote_match = re.match(r'^\s*>\s*(.*)$', line)
-        if blockquote_match:
-            processed_lines.append(f"| {blockquote_match.group(1)}")
-            continue
-
-        # Unordered List
-        list_match = re.match(r'^\s*[-*+]\s*(.*)$', line)
-        if list_match:
-            processed_lines.append(f"{list_bullet} {list_match.group(1)}")
-            continue
-
-        # Headers
-        header_match = re.match(r'^(#+)\s*(.*)$', line)
-        if header_match:
-            header_text = header_match.group(2)
-            if header_style == 'bold':
-                processed_lines.append(_to_bold(header_text))
-            else: # Default 'strip'
-                processed_lines.append(header_text)
-            continue
-
-        # Se não for um elemento de bloco conhecido, adicione a linha como está
-        processed_lines.append(line)
-
-    # Junta as linhas processadas para processar elementos inline
-    intermediate_text = "\n".join(processed_lines)
-
-    # 3. Processar elementos Inline
-    result_text = intermediate_text
-
-    # Ordem de processamento inline pode importar.
-    # Começando com elementos mais "internos" ou com caracteres especiais.
-
-    # Código Inline: `code` -> monospace
-    result_text = re.sub(r'(?<!\\)`(.+?)(?<!\\)`', _code_replacer, result_text)
-
-    # Strikethrough: ~~strikethrough~~ -> riscado
-    result_text = re.sub(r'~~(.+?)~~', _strikethrough_replacer, result_text)
-
-    # Bold: **bold** ou __bold__ -> bold Unicode
-    # Processa **
-    result_text = re.sub(r'(?<!\*)\*\*(.+?)\*\*(?!\*)', _bold_replacer_star, result_text)
-    # Processa __
-    result_text = re.sub(r'(?<!_)__(.+?)__(?!_)', _bold_replacer_underscore, result_text)
-
-    # Italic: *italic* ou _italic_ -> italic Unicode
-    # Cuidado: Evitar * em **texto**, _ em __texto__
-    result_text = re.sub(r'(?<![\\*])\*([^*]+?)\*(?![\\*])', _italic_replacer_star, result_text)
-    result_text = re.sub(r'(?<![\\_])_([^_]+?)_(?![\\_])', _italic_replacer_underscore, result_text)
-
-    # Link: [text](url) -> text
-    result_text = re.sub(r'\[(.+?)\]\(.+?\)', _link_replacer, result_text)
-
-    # Retornar o texto final com as conversões
-    return result_text
+# Cache de conversões compartilhado entre todas as sessões do servidor.
+# Reexecuções com o mesmo texto e as mesmas opções não convertem de novo.
+@st.cache_resource
+def get_conversion_cache() -> ConversionCache:
+    return ConversionCache(max_entries=512, ttl=3600)
 
 
 # --- Interface Streamlit ---
@@ -217,10 +48,7 @@ Use esta ferramenta para converter texto formatado com Markdown básico
 em texto usando caracteres Unicode estilizados que podem ser usados em redes sociais, etc.
 """)
 
-# Área de Input
-markdown_input = st.text_area(
-    "Cole seu texto Markdown aqui:",
-    value="""# Exemplo de Markdown
+DEFAULT_MARKDOWN = """# Exemplo de Markdown
 ## Título
 Olá, **mundo**! Este é um *exemplo* de texto.
 
@@ -243,36 +71,50 @@ Mais texto.
 ***
 
 Fim do exemplo.
-""",
-    height=300
-)
-
-# Opções na Sidebar
-st.sidebar.header("Opções de Conversão")
-
-list_bullet_char = st.sidebar.text_input(
-    "Caractere para Lista Não Ordenada:",
-    value="•"
-)
-
-header_style_option = st.sidebar.selectbox(
-    "Estilo dos Cabeçalhos:",
-    options=['strip', 'bold'], # strip = remove #, bold = aplica estilo bold
-    index=0 # strip como padrão
-)
-
-hr_char_option = st.sidebar.text_input(
-    "Caractere para Linha Horizontal:",
-    value="─" # U+2500 BOX DRAWINGS LIGHT HORIZONTAL
-)
-
-hr_length_option = st.sidebar.number_input(
-    "Comprimento da Linha Horizontal:",
-    min_value=5,
-    max_value=100,
-    value=30,
-    step=1
-)
+"""
+
+# Acima deste tamanho, a conversão só acontece ao clicar em "Converter"
+AUTO_CONVERT_MAX_CHARS = 50_000
+
+# Opções na Sidebar, agrupadas em um formulário: as mudanças só são aplicadas
+# (e só disparam uma nova conversão) ao enviar o formulário.
+with st.sidebar.form("opcoes_conversao"):
+    st.header("Opções de Conversão")
+
+    list_bullet_char = st.text_input(
+        "Caractere para Lista Não Ordenada:",
+        value="•",
+        max_chars=_MAX_OPTION_CHARS
+    )
+
+    header_style_option = st.selectbox(
+        "Estilo dos Cabeçalhos:",
+        options=['strip', 'bold'], # strip = remove #, bold = aplica estilo bold
+        index=0 # strip como padrão
+    )
+
+    hr_char_option = st.text_input(
+        "Caractere para Linha Horizontal:",
+        value="─", # U+2500 BOX DRAWINGS LIGHT HORIZONTAL
+        # Com o comprimento máximo abaixo (100), a linha ainda cabe no limite do Converter
+        max_chars=_MAX_HORIZONTAL_RULE_CHARS // 100
+    )
+
+    hr_length_option = st.number_input(
+        "Comprimento da Linha Horizontal:",
+        min_value=5,
+        max_value=100,
+        value=30,
+        step=1
+    )
+
+    manual_convert = st.checkbox(
+        "Converter só ao clicar em \"Converter\"",
+        value=False,
+        help=f"Sempre ativo para textos com mais de {AUTO_CONVERT_MAX_CHARS:,} caracteres.",
+    )
+
+    st.form_submit_button("Aplicar opções")
 
 
 # Coleta as opções em um dicionário
@@ -283,29 +125,214 @@ options_dict = {
     'horizontal_rule_length': hr_length_option,
 }
 
-# Realiza a conversão
-if markdown_input:
-    unicode_output = markdown_to_unicode(markdown_input, options_dict)
+
+def convert_markdown(markdown_text: str, options: dict) -> str:
+    """Converte pelo cache compartilhado, com orçamento de tempo e reconversão incremental."""
+    # Cada sessão guarda os blocos já convertidos: ao editar um parágrafo,
+    # só ele é reconvertido.
+    if 'incremental_converter' not in st.session_state:
+        st.session_state['incremental_converter'] = IncrementalConverter()
+    incremental_converter = st.session_state['incremental_converter']
+
+    def convert_within_budget(text: str, options: dict) -> str:
+        budget = ConversionBudget(TIME_BUDGET_SECONDS)
+        result = incremental_converter.convert(text, options, budget=budget)
+        if budget.degraded_blocks:
+            # Lançar impede que a saída degradada entre no cache
+            raise ConversionTimeoutError("Conversion time budget exhausted.", result)
+        return result
+
+    conversion_cache = get_conversion_cache()
+    try:
+        unicode_output = conversion_cache.convert(markdown_text, options, converter=convert_within_budget)
+    except ConversionTimeoutError as error:
+        unicode_output = error.fallback
+        st.warning("A conversão excedeu o tempo limite; parte do texto aparece sem formatação.", icon="⏱️")
+
+    cache_stats = conversion_cache.stats()
+    st.caption(
+        f"Cache de conversões: {cache_stats['hits']} acertos, {cache_stats['misses']} falhas, "
+        f"{cache_stats['size']} entradas"
+    )
+    return unicode_output
+
+
+# Botão que copia no navegador do usuário: o texto vai embutido no componente
+# e o clique não volta ao servidor.
+_COPY_BUTTON_HTML = """
+<button id="copy" style="font: inherit; padding: 0.4rem 0.9rem; border-radius: 0.5rem;
+        border: 1px solid rgba(49, 51, 63, 0.2); background: white; cursor: pointer;">Copiar Texto</button>
+<span id="status" style="margin-left: 0.6rem; font-family: sans-serif; font-size: 0.9rem;"></span>
+<script>
+const text = __TEXT__;
+const status = document.getElementById("status");
+function fallbackCopy() {
+    const area = document.createElement("textarea");
+    area.value = text;
+    area.style.position = "fixed";
+    area.style.opacity = "0";
+    document.body.appendChild(area);
+    area.select();
+    const copied = document.execCommand("copy");
+    document.body.removeChild(area);
+    return copied;
+}
+document.getElementById("copy").addEventListener("click", () => {
+    const done = () => { status.textContent = "Texto copiado para a área de transferência!"; };
+    const failed = () => { status.textContent = "Não foi possível copiar; selecione o texto manualmente."; };
+    if (navigator.clipboard && window.isSecureContext) {
+        navigator.clipboard.writeText(text).then(done, () => (fallbackCopy() ? done() : failed()));
+    } else {
+        fallbackCopy() ? done() : failed();
+    }
+});
+</script>
+"""
+
+
+def copy_button(text: str) -> None:
+    """Mostra um botão que copia `text` para a área de transferência do usuário."""
+    # <, > e & escapados para que o texto não possa fechar a tag <script> nem
+    # abrir um comentário HTML ou outra tag dentro dela
+    payload = json.dumps(text).replace("<", "\\u003c").replace(">", "\\u003e").replace("&", "\\u0026")
+    components.html(_COPY_BUTTON_HTML.replace("__TEXT__", payload), height=45)
+
+
+# Entrada e saída ficam em um fragmento: editar o texto reexecuta só esta
+# parte da página, sem redesenhar a sidebar, a ajuda e o rodapé.
+@st.fragment
+def conversion_area(options: dict, manual: bool) -> None:
+    # Área de Input
+    markdown_input = st.text_area(
+        "Cole seu texto Markdown aqui:",
+        max_chars=MAX_INPUT_CHARS,
+        value=DEFAULT_MARKDOWN,
+        height=300
+    )
+
+    if not markdown_input:
+        st.info("Cole seu texto Markdown na caixa acima para ver a conversão.")
+        return
+
+    if manual or len(markdown_input) > AUTO_CONVERT_MAX_CHARS:
+        # Modo explícito: converte apenas o texto enviado pelo botão
+        if st.button("Converter", type="primary"):
+            st.session_state['submitted_markdown'] = markdown_input
+        source = st.session_state.get('submitted_markdown')
+        if source is None:
+            st.info("Clique em \"Converter\" para ver a conversão.")
+            return
+        if source != markdown_input:
+            st.caption("O texto mudou desde a última conversão; clique em \"Converter\" para atualizar.")
+    else:
+        source = markdown_input
+
+    unicode_output = convert_markdown(source, options)
 
     # Área de Output
     st.subheader("Texto Unicode Convertido:")
 
     st.text(unicode_output) # Use st.text para exibir o texto bruto com os caracteres unicode
 
-    # Botão de copiar
-    if HAS_PYPERCLIP:
-        if st.button("Copiar Texto"):
-            pyperclip.copy(unicode_output)
-            st.success("Texto copiado para a área de transferência!")
-    else:
-        st.warning("A função de copiar está desabilitada porque `pyperclip` não está instalado.", icon="⚠️")
-
+    # Botão de copiar (no navegador, sem reexecutar o script)
+    copy_button(unicode_output)
 
     st.markdown("""
     <small>Copie o texto acima. A aparência pode variar dependendo da fonte e plataforma onde ele for colado.</small>
     """, unsafe_allow_html=True)
+
+
+def convert_upload(uploaded, options: dict, progress, budget: ConversionBudget) -> io.BytesIO:
+    """
+    Converte um arquivo enviado linha a linha, escrevendo o resultado já
+    codificado em UTF-8 e atualizando a barra de progresso. Quando o prazo
+    acaba, o restante sai sem estilos inline (`budget.degraded_blocks`).
+    """
+    total = max(uploaded.size, 1)
+    uploaded.seek(0)
+    reader = io.TextIOWrapper(uploaded, encoding='utf-8', errors='replace')
+    output = io.BytesIO()
+    writer = io.TextIOWrapper(output, encoding='utf-8', newline='')
+    shown = 0.0
+
+    def lines_with_progress():
+        nonlocal shown
+        for number, line in enumerate(reader):
+            if number % 2048 == 0:
+                done = min(uploaded.tell() / total, 1.0)
+                if done - shown >= 0.01:
+                    progress.progress(done, text=f"Convertendo... {done:.0%}")
+                    shown = done
+            yield line
+
+    convert_to_sink_with_limits(lines_with_progress(), writer, options, budget=budget)
+    writer.flush()
+    # Desacopla os wrappers para que não fechem o arquivo enviado nem a saída
+    writer.detach()
+    reader.detach()
+    progress.progress(1.0, text="Conversão concluída.")
+    output.seek(0)
+    return output
+
+
+def release_upload_result() -> None:
+    """Libera a saída convertida assim que o download é feito."""
+    result = st.session_state.pop('upload_result', None)
+    if result is not None:
+        st.session_state['upload_downloaded'] = result['key']
+
+
+@st.fragment
+def upload_area(options: dict) -> None:
+    uploaded = st.file_uploader(
+        f"Envie um arquivo Markdown (até {MAX_UPLOAD_BYTES // (1024 * 1024)} MB):",
+        type=['md', 'markdown', 'txt'],
+    )
+    if uploaded is None:
+        # Arquivo removido: descarta qualquer resultado ainda não baixado
+        st.session_state.pop('upload_result', None)
+        st.session_state.pop('upload_downloaded', None)
+        return
+    if uploaded.size > MAX_UPLOAD_BYTES:
+        st.error(f"O arquivo tem {uploaded.size:,} bytes; o limite é {MAX_UPLOAD_BYTES:,} bytes.")
+        return
+
+    # O resultado fica na sessão só até o download, e só para este arquivo e estas opções
+    key = (uploaded.file_id, Converter(options).options_key)
+    if st.session_state.get('upload_downloaded') == key:
+        st.success("Download concluído. Envie outro arquivo ou altere as opções para converter de novo.")
+        return
+    result = st.session_state.get('upload_result')
+    if result is None or result['key'] != key:
+        st.session_state.pop('upload_result', None)
+        progress = st.progress(0.0, text="Convertendo...")
+        budget = ConversionBudget(UPLOAD_TIME_BUDGET_SECONDS)
+        output = convert_upload(uploaded, options, progress, budget)
+        result = {'key': key, 'output': output, 'size': output.getbuffer().nbytes,
+                  'degraded': bool(budget.degraded_blocks)}
+        st.session_state['upload_result'] = result
+
+    stem = os.path.splitext(uploaded.name)[0] or 'convertido'
+    if result['degraded']:
+        st.warning("A conversão excedeu o tempo limite; parte do texto aparece sem formatação.", icon="⏱️")
+    st.caption(f"Resultado: {result['size']:,} bytes (UTF-8).")
+    st.download_button(
+        "Baixar texto convertido",
+        data=result['output'],
+        file_name=f"{stem}.txt",
+        mime='text/plain',
+        type='primary',
+        on_click=release_upload_result,
+    )
+
+
+input_mode = st.radio("Entrada:", ["Colar texto", "Enviar arquivo"], horizontal=True)
+if input_mode == "Enviar arquivo":
+    # Arquivos grandes não passam pelo text_area nem voltam inteiros para a
+    # página: a saída só é entregue pelo botão de download.
+    upload_area(options_dict)
 else:
-     st.info("Cole seu texto Markdown na caixa acima para ver a conversão.")
+    conversion_area(options_dict, manual_convert)
 
 st.markdown("---")
 st.write("Desenvolvido com ❤️ por Engº Paulo Rogério Veiga Silva!")
@@ -317,7 +344,9 @@ st.markdown("""
 *   ``` ~~strikethrough~~ ``` -> Riscado (T̶e̶x̶t̶)
 *   ``` [text](url) ``` -> Apenas o texto do link
 *   ``` # Header ```, ``` ## Subheader ```, etc. -> Texto simples ou Negrito (configurável)
-*   ``` > Blockquote ``` -> Texto precedido por `|`
+*   ``` > Blockquote ``` -> Texto precedido por `|` (`> >` para citações aninhadas)
 *   ``` * Item ```, ``` - Item ```, ``` + Item ``` -> Texto precedido por marcador de lista (configurável)
+*   ``` 1. Item ```, ``` 1) Item ``` -> Lista ordenada; itens recuados formam listas aninhadas
+*   Blocos entre cercas de três crases ou `~~~` -> Monospace Unicode, sem outros estilos
 *   ``` --- ```, ``` *** ```, ``` ___ ``` -> Linha horizontal (configurável)
 """)
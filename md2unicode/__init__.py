@@ -0,0 +1,53 @@
+"""
+Conversor de Markdown básico para caracteres Unicode estilizados.
+
+Este pacote contém apenas a lógica de conversão, em Python puro e sem efeitos
+colaterais na importação (nada de Streamlit ou pyperclip), para que possa ser
+usado por scripts e workers. A interface Streamlit fica em `converter.py`.
+"""
+
+from .batch import convert_many, convert_parallel
+from .blocks import block_line_counts
+from .cache import ConversionCache
+from .core import Converter, iter_markdown_to_unicode, markdown_to_sink, markdown_to_unicode
+from .document import Document, parse_markdown, render_html, render_plain, render_unicode
+from .incremental import IncrementalConverter
+from .jsonl import JsonlReport, convert_jsonl
+from .limits import (
+    ConversionBudget,
+    ConversionTimeoutError,
+    InputTooLargeError,
+    convert_to_sink_with_limits,
+    convert_with_limits,
+)
+from .reverse import unicode_to_markdown, unicode_to_plain
+from .stats import ConversionStats
+from .styles import stylize
+
+__all__ = [
+    "ConversionBudget",
+    "ConversionCache",
+    "ConversionStats",
+    "ConversionTimeoutError",
+    "Converter",
+    "Document",
+    "IncrementalConverter",
+    "InputTooLargeError",
+    "JsonlReport",
+    "block_line_counts",
+    "convert_jsonl",
+    "convert_many",
+    "convert_parallel",
+    "convert_to_sink_with_limits",
+    "convert_with_limits",
+    "iter_markdown_to_unicode",
+    "markdown_to_sink",
+    "markdown_to_unicode",
+    "parse_markdown",
+    "render_html",
+    "render_plain",
+    "render_unicode",
+    "stylize",
+    "unicode_to_markdown",
+    "unicode_to_plain",
+]
@@ -0,0 +1,205 @@
+"""Conversão em lote de muitos documentos em um pool de processos."""
+
+import os
+import re
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from .blocks import _next_fence
+from .core import Converter
+
+# Conversor definido uma vez por processo pelo initializer do pool
+_WORKER_CONVERTER: Optional[Converter] = None
+
+# Documentos menores que isto são convertidos em série por convert_parallel
+_DEFAULT_PARALLEL_THRESHOLD = 8 * 1024 * 1024
+# Tamanho mínimo de um pedaço: abaixo disso o custo de IPC domina
+_MIN_PARALLEL_CHUNK = 1024 * 1024
+
+# Quebra de linha seguida de uma linha em branco; cortar logo após o '\n'
+# separa o documento em dois trechos que se convertem de forma independente.
+_BLANK_LINE_BOUNDARY_RE = re.compile(r'\n[ \t]*(?:\r\n?|\n)')
+# Linhas que podem abrir ou fechar um bloco de código cercado, com o início de
+# linha definido pelos mesmos separadores de str.splitlines()
+_LINE_BREAKS = '\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029'
+_FENCE_LINE_RE = re.compile(f'(?:^|(?<=[{_LINE_BREAKS}])) {{0,3}}(?:`{{3,}}|~{{3,}})[^{_LINE_BREAKS}]*')
+
+
+def _init_worker(converter: Converter) -> None:
+    """Guarda o conversor no processo worker (executado uma vez por processo)."""
+    global _WORKER_CONVERTER
+    _WORKER_CONVERTER = converter
+
+
+def _convert_chunk(chunk: List[str]) -> List[Union[str, Exception]]:
+    """Converte um lote de textos; erros de um item não interrompem os demais."""
+    assert _WORKER_CONVERTER is not None
+    convert = _WORKER_CONVERTER.convert
+    results: List[Union[str, Exception]] = []
+    for text in chunk:
+        try:
+            results.append(convert(text))
+        except Exception as error:
+            results.append(error)
+    return results
+
+
+def _convert_text(text: str) -> str:
+    """Converte um trecho de documento com o conversor do worker."""
+    assert _WORKER_CONVERTER is not None
+    return _WORKER_CONVERTER.convert(text)
+
+
+def _split_blocks(text: str, parts: int) -> List[str]:
+    """
+    Divide o texto em até `parts` trechos de tamanho parecido, sempre no início
+    de uma linha em branco fora de blocos de código cercados.
+
+    Nenhum outro elemento atravessa uma linha em branco, então a conversão de
+    cada trecho, unida por '\n', é idêntica à conversão do texto inteiro.
+    """
+    target = max(len(text) // parts, 1)
+    fence_lines = _FENCE_LINE_RE.finditer(text) if '```' in text or '~~~' in text else iter(())
+    fence_line = next(fence_lines, None)
+    fence = None
+    chunks: List[str] = []
+    start = search_from = 0
+    while len(chunks) < parts - 1:
+        match = _BLANK_LINE_BOUNDARY_RE.search(text, max(search_from, start + target))
+        if match is None:
+            break
+        cut = match.start() + 1
+        # Acompanha as cercas até o ponto de corte; dentro de uma, procura adiante
+        while fence_line is not None and fence_line.start() < cut:
+            fence = _next_fence(fence_line.group(), fence)
+            fence_line = next(fence_lines, None)
+        if fence is not None:
+            search_from = cut
+            continue
+        chunks.append(text[start:cut])
+        start = search_from = cut
+    chunks.append(text[start:])
+    return chunks
+
+
+def _iter_chunks(texts: Iterable[str], chunksize: int) -> Iterator[List[str]]:
+    """Divide um iterável de textos em listas de até `chunksize` itens."""
+    iterator = iter(texts)
+    while True:
+        chunk = list(islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def convert_many(
+    texts: Iterable[str],
+    options: Union[Converter, Dict[str, Any], None] = None,
+    workers: Optional[int] = None,
+    chunksize: int = 256,
+    return_exceptions: bool = False,
+) -> List[Union[str, Exception]]:
+    """
+    Converte muitos documentos com markdown_to_unicode, distribuindo o trabalho
+    entre processos.
+
+    As opções são validadas uma única vez (em um Converter) e enviadas a cada
+    worker na sua inicialização; cada tarefa leva `chunksize` textos, o que
+    dilui o custo de comunicação entre processos para documentos curtos.
+
+    Args:
+        texts: Os textos Markdown a converter.
+        options: As mesmas opções de markdown_to_unicode, ou um Converter pronto.
+        workers: Número de processos (padrão: os.cpu_count()). Com 1, converte
+                 no próprio processo, sem pool.
+        chunksize: Quantidade de textos enviada a um worker por tarefa.
+        return_exceptions: Se True, um item que falhar aparece no resultado como
+                 a exceção correspondente, sem perder o restante do lote. Se
+                 False (padrão), a primeira exceção é relançada.
+
+    Returns:
+        Os textos convertidos, na mesma ordem da entrada.
+    """
+    if isinstance(texts, str):
+        raise TypeError("texts must be an iterable of strings, not a string.")
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1.")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be at least 1.")
+
+    converter = options if isinstance(options, Converter) else Converter(options)
+
+    if workers == 1:
+        _init_worker(converter)
+        chunk_results: Iterable[List[Union[str, Exception]]] = map(_convert_chunk, _iter_chunks(texts, chunksize))
+        results = [item for chunk in chunk_results for item in chunk]
+    else:
+        # Importado sob demanda: concurrent.futures carrega multiprocessing e
+        # logging, o que pesaria na importação do pacote.
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(converter,)) as executor:
+            results = [item for chunk in executor.map(_convert_chunk, _iter_chunks(texts, chunksize))
+                       for item in chunk]
+
+    if not return_exceptions:
+        for item in results:
+            if isinstance(item, Exception):
+                raise item
+    return results
+
+
+def convert_parallel(
+    markdown_text: str,
+    options: Union[Converter, Dict[str, Any], None] = None,
+    workers: Optional[int] = None,
+    threshold: int = _DEFAULT_PARALLEL_THRESHOLD,
+    chunks_per_worker: int = 4,
+) -> str:
+    """
+    Converte um único documento grande usando vários processos.
+
+    O texto é dividido em linhas em branco em trechos de tamanho equilibrado
+    (cerca de `chunks_per_worker` por processo, com pelo menos 1 MiB cada),
+    convertidos em paralelo e reunidos na ordem original. O resultado é
+    idêntico byte a byte ao de markdown_to_unicode.
+
+    Args:
+        markdown_text: A string contendo Markdown.
+        options: As mesmas opções de markdown_to_unicode, ou um Converter pronto.
+        workers: Número de processos (padrão: os.cpu_count()).
+        threshold: Abaixo deste tamanho (em caracteres), ou se o texto não
+                   puder ser dividido, a conversão é feita em série, no
+                   próprio processo.
+        chunks_per_worker: Trechos por processo; mais trechos equilibram melhor
+                   a carga quando os blocos têm custos diferentes.
+
+    Returns:
+        A string convertida com caracteres Unicode.
+    """
+    if not isinstance(markdown_text, str):
+        raise TypeError("Input must be a string.")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be at least 1.")
+    if chunks_per_worker < 1:
+        raise ValueError("chunks_per_worker must be at least 1.")
+
+    converter = options if isinstance(options, Converter) else Converter(options)
+    if workers == 1 or len(markdown_text) < threshold:
+        return converter.convert(markdown_text)
+
+    parts = min(workers * chunks_per_worker, max(len(markdown_text) // _MIN_PARALLEL_CHUNK, 1))
+    chunks = _split_blocks(markdown_text, parts)
+    if len(chunks) == 1:
+        return converter.convert(markdown_text)
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks)), initializer=_init_worker,
+                             initargs=(converter,)) as executor:
+        return "\n".join(executor.map(_convert_text, chunks))
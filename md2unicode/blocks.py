@@ -0,0 +1,182 @@
+"""
+Classificação de linhas de bloco em uma única passagem.
+
+Além dos elementos de uma linha só (linha horizontal, citação, cabeçalho),
+o estado carregado de uma linha para a seguinte permite reconhecer blocos de
+código cercados (``` ou ~~~), listas ordenadas e o aninhamento de listas.
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+# --- Tipos de Linha de Bloco ---
+_BLOCK_TEXT = 'text'
+_BLOCK_HORIZONTAL_RULE = 'horizontal_rule'
+_BLOCK_BLOCKQUOTE = 'blockquote'
+_BLOCK_LIST = 'list'
+_BLOCK_ORDERED_LIST = 'ordered_list'
+_BLOCK_HEADER = 'header'
+_BLOCK_CODE_FENCE = 'code_fence' # Linha de abertura ou fechamento da cerca
+_BLOCK_CODE = 'code' # Conteúdo de um bloco cercado
+
+_BLOCK_KINDS = (_BLOCK_TEXT, _BLOCK_HORIZONTAL_RULE, _BLOCK_BLOCKQUOTE, _BLOCK_LIST, _BLOCK_ORDERED_LIST,
+                _BLOCK_HEADER, _BLOCK_CODE_FENCE, _BLOCK_CODE)
+
+# Linhas que não passam pelo processamento inline
+_LITERAL_BLOCKS = frozenset((_BLOCK_CODE_FENCE, _BLOCK_CODE))
+
+# Padrões compilados uma vez; só são testados quando o primeiro caractere
+# não-espaço da linha pode iniciar o elemento correspondente.
+_HORIZONTAL_RULE_RE = re.compile(r'\s*([-*_])(\s*\1){2,}\s*')
+_BLOCKQUOTE_RE = re.compile(r'\s*((?:>\s*)+)(.*)')
+_LIST_RE = re.compile(r'(\s*)[-*+](?:\s+(.*))?')  # marcador seguido de espaço (ou sozinho)
+_ORDERED_LIST_RE = re.compile(r'(\s*)(\d{1,9}[.)])(?:\s+(.*))?')
+_HEADER_RE = re.compile(r'(#+)\s*(.*)')
+# Até 3 espaços, 3 ou mais crases (ou tils) e uma info string opcional; a info
+# de uma cerca de crases não pode conter crases, senão é código inline.
+_FENCE_OPEN_RE = re.compile(r' {0,3}(?:(`{3,})[^`]*|(~{3,}).*)')
+_FENCE_CLOSE_RE = re.compile(r' {0,3}(`{3,}|~{3,})\s*')
+
+_BLOCK_MARKERS = frozenset('-*_>+#`~0123456789')
+
+# Uma cerca aberta: (caractere, comprimento)
+_Fence = Tuple[str, int]
+
+
+def _open_fence(line: str) -> Optional[_Fence]:
+    """Retorna a cerca aberta pela linha, ou None se ela não abre um bloco de código."""
+    match = _FENCE_OPEN_RE.fullmatch(line)
+    if match is None:
+        return None
+    marker = match.group(1) or match.group(2)
+    return marker[0], len(marker)
+
+
+def _closes_fence(line: str, fence: _Fence) -> bool:
+    """True se a linha fecha a cerca (mesmo caractere, pelo menos o mesmo comprimento)."""
+    match = _FENCE_CLOSE_RE.fullmatch(line)
+    return match is not None and match.group(1)[0] == fence[0] and len(match.group(1)) >= fence[1]
+
+
+def _next_fence(line: str, fence: Optional[_Fence]) -> Optional[_Fence]:
+    """
+    Estado da cerca depois da linha. Usado por quem precisa dividir um texto
+    sem cortar blocos de código (IncrementalConverter, convert_parallel).
+    """
+    if fence is not None:
+        return None if _closes_fence(line, fence) else fence
+    stripped = line.lstrip(' ')
+    if stripped[:1] in ('`', '~'):
+        return _open_fence(line)
+    return None
+
+
+def _indent_width(prefix: str) -> int:
+    """Largura de um recuo, contando tabulações como 4 colunas."""
+    return len(prefix.expandtabs(4)) if '\t' in prefix else len(prefix)
+
+
+class _BlockState:
+    """
+    Estado da passagem de blocos: a cerca aberta e os recuos das listas em aberto.
+
+    Uma linha em branco (fora de blocos de código) encerra as listas, então,
+    como antes, nenhum estado atravessa uma linha em branco a não ser um bloco
+    de código cercado.
+    """
+
+    __slots__ = ('fence', 'list_indents')
+
+    def __init__(self) -> None:
+        self.fence: Optional[_Fence] = None
+        self.list_indents: List[int] = []
+
+    def classify(self, line: str) -> Tuple[str, str, int]:
+        """
+        Classifica uma linha e avança o estado.
+
+        Returns:
+            Uma tupla (tipo, conteúdo, nível), onde tipo é um dos valores de
+            _BLOCK_KINDS. O nível é a profundidade do item (listas) ou da
+            citação; para linhas de texto e de código, o conteúdo é a própria linha.
+        """
+        fence = self.fence
+        if fence is not None:
+            if _closes_fence(line, fence):
+                self.fence = None
+                return _BLOCK_CODE_FENCE, '', 0
+            return _BLOCK_CODE, line, 0
+
+        stripped = line.lstrip()
+        if not stripped:
+            if self.list_indents:
+                self.list_indents = []
+            return _BLOCK_TEXT, line, 0
+        first = stripped[0]
+        if first not in _BLOCK_MARKERS:
+            return _BLOCK_TEXT, line, 0
+
+        if first in '-*_':
+            # Horizontal Rule (verificada primeiro, pois consome a linha inteira)
+            if _HORIZONTAL_RULE_RE.fullmatch(line):
+                self.list_indents = []
+                return _BLOCK_HORIZONTAL_RULE, '', 0
+            if first == '_':
+                return _BLOCK_TEXT, line, 0
+        elif first == '>':
+            match = _BLOCKQUOTE_RE.match(line)
+            return _BLOCK_BLOCKQUOTE, match.group(2), match.group(1).count('>')
+        elif first == '#':
+            # Cabeçalhos precisam começar na primeira coluna
+            match = _HEADER_RE.match(line) if line[0] == '#' else None
+            if match:
+                self.list_indents = []
+                return _BLOCK_HEADER, match.group(2), 0
+            return _BLOCK_TEXT, line, 0
+        elif first in '`~':
+            opened = _open_fence(line)
+            if opened is None:
+                return _BLOCK_TEXT, line, 0
+            self.fence = opened
+            self.list_indents = []
+            return _BLOCK_CODE_FENCE, '', 0
+        elif first != '+':
+            # Um dígito: item de lista ordenada ("1." ou "1)")
+            match = _ORDERED_LIST_RE.fullmatch(line)
+            if match is None:
+                return _BLOCK_TEXT, line, 0
+            level = self._list_level(match.group(1))
+            return _BLOCK_ORDERED_LIST, f"{match.group(2)} {match.group(3) or ''}", level
+
+        # Restam '-', '*' e '+': item de lista não ordenada
+        match = _LIST_RE.fullmatch(line)
+        if match is None:
+            return _BLOCK_TEXT, line, 0
+        return _BLOCK_LIST, match.group(2) or '', self._list_level(match.group(1))
+
+    def _list_level(self, prefix: str) -> int:
+        """Nível de aninhamento de um item com o recuo dado, atualizando a pilha."""
+        indent = _indent_width(prefix)
+        indents = self.list_indents
+        while indents and indent < indents[-1]:
+            indents.pop()
+        if not indents or indent > indents[-1]:
+            indents.append(indent)
+        return len(indents) - 1
+
+
+def block_line_counts(markdown_text: str) -> Dict[str, int]:
+    """
+    Conta quantas linhas de um texto caem em cada tipo de bloco (diagnóstico).
+
+    Args:
+        markdown_text: A string contendo Markdown.
+
+    Returns:
+        Um dicionário {tipo: quantidade} com todos os tipos de _BLOCK_KINDS.
+    """
+    counts: Dict[str, int] = dict.fromkeys(_BLOCK_KINDS, 0)
+    classify = _BlockState().classify
+    for line in markdown_text.splitlines():
+        counts[classify(line)[0]] += 1
+    return counts
@@ -0,0 +1,91 @@
+"""Cache LRU com expiração para resultados de conversão."""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from .core import Converter
+
+_CacheKey = Tuple[bytes, Tuple[Tuple[str, Any], ...]]
+
+
+class ConversionCache:
+    """
+    Memoiza markdown_to_unicode por (hash do texto, opções canônicas).
+
+    É seguro para uso concorrente (várias sessões do Streamlit podem compartilhar
+    uma instância). As entradas mais antigas são descartadas quando o cache passa
+    de `max_entries`, e entradas com mais de `ttl` segundos são recalculadas.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl: Optional[float] = 3600.0) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[_CacheKey, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def convert(
+        self,
+        markdown_text: str,
+        options: Union[Converter, Dict[str, Any], None] = None,
+        converter: Optional[Callable[[str, Dict[str, Any]], str]] = None,
+    ) -> str:
+        """
+        Retorna a conversão em cache ou converte e guarda o resultado.
+
+        As opções (um dicionário ou um Converter) entram na chave na sua forma
+        canônica, então dicionários equivalentes compartilham a mesma entrada.
+        `converter`, se informado, é chamado como converter(texto, opções) em
+        caso de falha no cache (por exemplo, IncrementalConverter.convert) e
+        deve produzir o mesmo resultado que markdown_to_unicode.
+        """
+        if not isinstance(markdown_text, str):
+            raise TypeError("Input must be a string.")
+        text_converter = options if isinstance(options, Converter) else Converter(options)
+        key = (hashlib.blake2b(markdown_text.encode('utf-8', 'surrogatepass'), digest_size=16).digest(),
+               text_converter.options_key)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (self.ttl is None or now - entry[0] < self.ttl):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        # A conversão roda fora do lock para não serializar as sessões
+        if converter is None:
+            result = text_converter.convert(markdown_text)
+        else:
+            result = converter(markdown_text, text_converter.options)
+
+        with self._lock:
+            self._entries[key] = (now, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return result
+
+    def stats(self) -> Dict[str, int]:
+        """Contadores de uso: acertos, falhas, descartes e tamanho atual."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._entries),
+            }
+
+    def clear(self) -> None:
+        """Remove todas as entradas (os contadores são mantidos)."""
+        with self._lock:
+            self._entries.clear()
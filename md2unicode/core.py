@@ -0,0 +1,421 @@
+"""Conversão de Markdown básico para texto com caracteres Unicode estilizados."""
+
+import re
+from time import perf_counter
+from typing import Optional, Dict, Any, Callable, Iterable, Iterator, List, Tuple, Union
+
+from .blocks import (
+    _BLOCK_BLOCKQUOTE,
+    _BLOCK_CODE,
+    _BLOCK_CODE_FENCE,
+    _BLOCK_HORIZONTAL_RULE,
+    _BLOCK_LIST,
+    _BLOCK_ORDERED_LIST,
+    _BLOCK_TEXT,
+    _LITERAL_BLOCKS,
+    _BlockState,
+)
+from .inline import _render_inline, _render_inline_instrumented
+from .stats import ConversionStats
+from .styles import _to_bold, _to_monospace
+
+# Recuo de cada nível de lista aninhada na saída
+_LIST_INDENT = '  '
+
+# Um destino de texto: qualquer objeto com write() (arquivo, io.StringIO,
+# socket.makefile('w')), uma lista (append) ou uma função que recebe cada pedaço
+_TextSink = Union[Any, List[str], Callable[[str], Any]]
+
+# Pedaços pequenos são agrupados até este tamanho antes de cada escrita
+_SINK_BUFFER_CHARS = 64 * 1024
+
+# Terminadores de linha, os mesmos de str.splitlines(). Procurar só o
+# terminador (e não a linha inteira) evita que um trecho final sem quebra seja
+# percorrido de novo a partir de cada posição.
+_LINE_BREAK_RE = re.compile('\r\n|[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]')
+
+# --- Opções ---
+_DEFAULT_OPTIONS: Dict[str, Any] = {
+    'list_bullet': '•',
+    'header_style': 'strip', # 'strip' ou 'bold'
+    'horizontal_rule_char': '─', # Caractere para HR
+    'horizontal_rule_length': 20, # Comprimento padrão da HR
+}
+
+
+# Limites das opções que viram texto na saída: sem eles, poucos bytes de opções
+# fariam cada item de lista ou linha horizontal crescer sem limite razoável
+_MAX_OPTION_CHARS = 64
+_MAX_HORIZONTAL_RULE_CHARS = 1024
+
+
+def _is_valid_option(key: str, value: Any) -> bool:
+    """Regras de validação das opções (valores inválidos são ignorados)."""
+    if key in ('list_bullet', 'horizontal_rule_char'):
+        return isinstance(value, str) and 0 < len(value) <= _MAX_OPTION_CHARS
+    if key == 'header_style':
+        return value in ('strip', 'bold')
+    if key == 'horizontal_rule_length':
+        return (isinstance(value, int) and not isinstance(value, bool)
+                and 0 < value <= _MAX_HORIZONTAL_RULE_CHARS)
+    return False
+
+
+def _resolve_options(options: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Combina as opções do usuário com os padrões, ignorando valores inválidos."""
+    effective_options = dict(_DEFAULT_OPTIONS)
+    if options:
+        for key, value in options.items():
+            if key in effective_options and _is_valid_option(key, value):
+                effective_options[key] = value
+        # Uma linha horizontal longa demais também é inválida: volta ao padrão
+        if (len(effective_options['horizontal_rule_char']) * effective_options['horizontal_rule_length']
+                > _MAX_HORIZONTAL_RULE_CHARS):
+            effective_options['horizontal_rule_char'] = _DEFAULT_OPTIONS['horizontal_rule_char']
+            effective_options['horizontal_rule_length'] = _DEFAULT_OPTIONS['horizontal_rule_length']
+    return effective_options
+
+
+# --- Conversor Reutilizável ---
+class Converter:
+    """
+    Conversor imutável, criado uma vez a partir das opções.
+
+    As opções são validadas na construção e os valores derivados delas (linha
+    horizontal pronta, prefixo de lista, estilo dos cabeçalhos) ficam guardados,
+    então cada chamada a convert() faz apenas a conversão. Os padrões e as
+    tabelas de tradução são compilados uma vez no nível do módulo. Como não há
+    estado mutável, uma mesma instância pode ser compartilhada entre threads e
+    sessões.
+
+    Args:
+        options: As mesmas opções de markdown_to_unicode.
+    """
+
+    __slots__ = ('_options', '_list_prefix', '_bold_headers', '_horizontal_rule')
+
+    def __init__(self, options: Optional[Dict[str, Any]] = None) -> None:
+        effective_options = _resolve_options(options)
+        set_attribute = object.__setattr__
+        set_attribute(self, '_options', tuple(sorted(effective_options.items())))
+        set_attribute(self, '_list_prefix', f"{effective_options['list_bullet']} ")
+        set_attribute(self, '_bold_headers', effective_options['header_style'] == 'bold')
+        set_attribute(self, '_horizontal_rule',
+                      effective_options['horizontal_rule_char'] * effective_options['horizontal_rule_length'])
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("Converter instances are immutable.")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("Converter instances are immutable.")
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Permite enviar a instância a outros processos (pickle)
+        return (Converter, (self.options,))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Converter):
+            return NotImplemented
+        return self._options == other._options
+
+    def __hash__(self) -> int:
+        return hash(self._options)
+
+    def __repr__(self) -> str:
+        return f"Converter({self.options!r})"
+
+    @property
+    def options(self) -> Dict[str, Any]:
+        """As opções efetivas (já validadas e completadas com os padrões)."""
+        return dict(self._options)
+
+    @property
+    def options_key(self) -> Tuple[Tuple[str, Any], ...]:
+        """Forma canônica e hashable das opções efetivas."""
+        return self._options
+
+    def convert(self, markdown_text: str, stats: Optional[ConversionStats] = None) -> str:
+        """Converte um texto completo; equivale a markdown_to_unicode."""
+        if not isinstance(markdown_text, str):
+            # Em um app web, talvez seja melhor retornar string vazia ou mensagem de erro
+            # mas manter a validação ajuda durante o desenvolvimento.
+            # return ""
+            raise TypeError("Input must be a string.")
+        if stats is None:
+            return "".join(_convert_lines(markdown_text.splitlines(), self))
+
+        chunks = list(_convert_lines_instrumented(markdown_text.splitlines(), self, stats))
+        started = perf_counter()
+        result = "".join(chunks)
+        stats.join_seconds += perf_counter() - started
+        stats.conversions += 1
+        stats.output_characters += len(result)
+        return result
+
+    def convert_to(self, markdown: Union[str, Iterable[str]], sink: _TextSink,
+                   stats: Optional[ConversionStats] = None) -> int:
+        """Escreve a conversão em um destino de texto; equivale a markdown_to_sink."""
+        if isinstance(markdown, str):
+            lines = _iter_text_lines(markdown)
+        else:
+            lines = _iter_source_lines(markdown)
+        if stats is None:
+            return _write_chunks(_convert_lines(lines, self), sink)
+        stats.conversions += 1
+        written = _write_chunks(_convert_lines_instrumented(lines, self, stats), sink)
+        stats.output_characters += written
+        return written
+
+    def iter_convert(self, lines: Iterable[str], stats: Optional[ConversionStats] = None) -> Iterator[str]:
+        """Converte um iterável de linhas em streaming; equivale a iter_markdown_to_unicode."""
+        if isinstance(lines, str):
+            raise TypeError("Input must be an iterable of lines, not a string.")
+        if stats is None:
+            return _convert_lines(_iter_source_lines(lines), self)
+        stats.conversions += 1
+        return _convert_lines_instrumented(_iter_source_lines(lines), self, stats)
+
+
+# --- Conversão por Blocos ---
+def _iter_source_lines(source: Iterable[str]) -> Iterator[str]:
+    """Normaliza um iterável de linhas (com ou sem terminador) em linhas sem terminador."""
+    for item in source:
+        # splitlines() segue as mesmas quebras de markdown_to_unicode; um item
+        # vazio (ou só com o terminador) continua sendo uma linha em branco.
+        yield from item.splitlines() or ('',)
+
+
+def _iter_text_lines(text: str) -> Iterator[str]:
+    """Percorre as linhas de um texto como str.splitlines(), sem criar a lista inteira."""
+    start = 0
+    for match in _LINE_BREAK_RE.finditer(text):
+        yield text[start:match.start()]
+        start = match.end()
+    if start < len(text):
+        yield text[start:]
+
+
+def _sink_writer(sink: _TextSink) -> Callable[[str], Any]:
+    """Resolve o método de escrita de um destino de texto."""
+    write = getattr(sink, 'write', None)
+    if write is not None:
+        return write
+    if isinstance(sink, list):
+        return sink.append
+    if callable(sink):
+        return sink
+    raise TypeError("sink must have a write() method, be a list or be callable.")
+
+
+def _write_chunks(chunks: Iterable[str], sink: _TextSink) -> int:
+    """Escreve os pedaços no destino, agrupando os pequenos; retorna o total de caracteres."""
+    write = _sink_writer(sink)
+    pending: List[str] = []
+    pending_size = written = 0
+    for chunk in chunks:
+        pending.append(chunk)
+        pending_size += len(chunk)
+        if pending_size >= _SINK_BUFFER_CHARS:
+            write("".join(pending))
+            written += pending_size
+            pending = []
+            pending_size = 0
+    if pending:
+        write("".join(pending))
+        written += pending_size
+    return written
+
+
+def _convert_block_line(line: str, converter: Converter, state: _BlockState) -> Tuple[str, str]:
+    """Converte os elementos de bloco de uma linha, retornando (tipo, linha processada)."""
+    kind, content, level = state.classify(line)
+
+    if kind is _BLOCK_TEXT:
+        # Se não for um elemento de bloco conhecido, mantém a linha como está
+        return kind, line
+    if kind is _BLOCK_CODE:
+        # Conteúdo de bloco cercado: só monoespaçado, sem processamento inline
+        return kind, _to_monospace(content)
+    if kind is _BLOCK_CODE_FENCE:
+        return kind, ''
+    if kind is _BLOCK_HORIZONTAL_RULE:
+        return kind, converter._horizontal_rule
+    if kind is _BLOCK_BLOCKQUOTE:
+        return kind, "| " * level + content
+    if kind is _BLOCK_LIST:
+        return kind, _LIST_INDENT * level + converter._list_prefix + content
+    if kind is _BLOCK_ORDERED_LIST:
+        return kind, _LIST_INDENT * level + content
+    if converter._bold_headers:
+        return kind, _to_bold(content)
+    return kind, content # Default 'strip'
+
+
+def _iter_blocks(
+    lines: Iterable[str],
+    converter: Any,
+    render_paragraph: Callable[[str], Any],
+    convert_line: Callable[[str, Any, _BlockState], Tuple[Optional[str], Any]] = _convert_block_line,
+) -> Iterator[Tuple[Optional[str], Any]]:
+    """
+    Laço comum a todos os caminhos de conversão: agrupa as linhas em parágrafos.
+
+    Cada linha passa por convert_line(linha, converter, estado), que retorna
+    (tipo, linha processada). Linhas não vazias fora de blocos de código se
+    acumulam no parágrafo atual; elementos inline nunca atravessam linhas em
+    branco nem blocos de código. Produz (None, render_paragraph(parágrafo))
+    para cada parágrafo e o próprio par de convert_line para as demais linhas,
+    na ordem do texto.
+    """
+    state = _BlockState()
+    paragraph: List[str] = []
+    for line in lines:
+        converted = convert_line(line, converter, state)
+        kind, processed = converted
+        if processed.strip() and kind not in _LITERAL_BLOCKS:
+            paragraph.append(processed)
+            continue
+        if paragraph:
+            yield None, render_paragraph("\n".join(paragraph))
+            paragraph = []
+        yield converted
+
+    if paragraph:
+        yield None, render_paragraph("\n".join(paragraph))
+
+
+def _convert_lines(
+    lines: Iterable[str],
+    converter: Converter,
+    render_paragraph: Callable[[str], str] = _render_inline,
+    convert_line: Callable[[str, Converter, _BlockState], Tuple[str, str]] = _convert_block_line,
+) -> Iterator[str]:
+    """
+    Converte linhas sem terminador, produzindo a saída bloco a bloco.
+
+    Cada parágrafo (linhas entre linhas em branco) é convertido por
+    `render_paragraph` assim que termina, e cada pedaço produzido a partir do
+    segundo começa com '\n'. Assim, "".join() dos pedaços é exatamente o
+    resultado de markdown_to_unicode. Linhas de blocos de código cercados saem
+    uma a uma, sem processamento inline.
+    """
+    separator = ""
+    for _, output in _iter_blocks(lines, converter, render_paragraph, convert_line):
+        yield separator + output
+        separator = "\n"
+
+
+def _convert_lines_instrumented(lines: Iterable[str], converter: Converter, stats: ConversionStats) -> Iterator[str]:
+    """Como _convert_lines, registrando tempos e contadores em `stats`."""
+    block_counts = stats.block_counts
+
+    def convert_line(line: str, converter: Converter, state: _BlockState) -> Tuple[str, str]:
+        started = perf_counter()
+        kind, processed = _convert_block_line(line, converter, state)
+        stats.block_seconds += perf_counter() - started
+        stats.lines += 1
+        stats.input_characters += len(line)
+        block_counts[kind] = block_counts.get(kind, 0) + 1
+        return kind, processed
+
+    def render_paragraph(text: str) -> str:
+        stats.paragraphs += 1
+        return _render_inline_instrumented(text, stats)
+
+    return _convert_lines(lines, converter, render_paragraph, convert_line)
+
+
+_DEFAULT_CONVERTER = Converter()
+
+
+def _get_converter(options: Optional[Dict[str, Any]]) -> Converter:
+    """Retorna o conversor para as opções, reaproveitando o padrão quando possível."""
+    if not options:
+        return _DEFAULT_CONVERTER
+    return Converter(options)
+
+
+# --- Função Principal ---
+def markdown_to_unicode(
+    markdown_text: str,
+    options: Optional[Dict[str, Any]] = None,
+    stats: Optional[ConversionStats] = None,
+) -> str:
+    """
+    Converte uma string Markdown básica para uma string usando caracteres Unicode estilizados.
+
+    Args:
+        markdown_text: A string contendo Markdown.
+        options: Um dicionário opcional para configurar a conversão.
+                 Opções suportadas (valores inválidos são ignorados):
+                 - 'list_bullet' (str): O caractere a usar para itens de lista não ordenada, até 64 caracteres (padrão: '•').
+                 - 'header_style' (str): Estilo para cabeçalhos ('strip' para remover #, 'bold' para aplicar bold, padrão: 'strip').
+                 - 'horizontal_rule_char' (str): O caractere a usar para a linha horizontal, até 64 caracteres (padrão: '─').
+                 - 'horizontal_rule_length' (int): O comprimento da linha horizontal, maior que zero (padrão: 20).
+                   A linha inteira tem no máximo 1024 caracteres; acima disso, volta aos padrões.
+
+        stats: Um ConversionStats opcional, preenchido com o tempo de cada etapa e
+               contadores de elementos reconhecidos. Sem ele, não há custo de
+               instrumentação.
+
+    Para muitas chamadas com as mesmas opções, prefira criar um Converter uma vez.
+
+    Returns:
+        A string convertida com caracteres Unicode.
+    """
+    return _get_converter(options).convert(markdown_text, stats)
+
+
+def iter_markdown_to_unicode(
+    lines: Iterable[str],
+    options: Optional[Dict[str, Any]] = None,
+    stats: Optional[ConversionStats] = None,
+) -> Iterator[str]:
+    """
+    Versão em streaming de markdown_to_unicode.
+
+    Aceita qualquer iterável de linhas (com ou sem '\\n' no final), inclusive um
+    arquivo de texto aberto, e produz a saída convertida bloco a bloco. Só o
+    parágrafo atual fica em memória, então o consumo não depende do tamanho
+    total do documento.
+
+    Args:
+        lines: Iterável de linhas ou arquivo de texto.
+        options: As mesmas opções de markdown_to_unicode.
+        stats: Um ConversionStats opcional (como em markdown_to_unicode).
+
+    Yields:
+        Pedaços da saída; "".join() deles é igual a markdown_to_unicode do
+        texto completo.
+    """
+    return _get_converter(options).iter_convert(lines, stats)
+
+
+def markdown_to_sink(
+    markdown: Union[str, Iterable[str]],
+    sink: _TextSink,
+    options: Optional[Dict[str, Any]] = None,
+    stats: Optional[ConversionStats] = None,
+) -> int:
+    """
+    Converte Markdown escrevendo a saída diretamente em um destino de texto.
+
+    A saída é produzida parágrafo a parágrafo e escrita em blocos de até 64 KiB,
+    sem montar a string convertida completa; um texto de entrada é percorrido
+    linha a linha, sem ser copiado. Assim, além da entrada, só o parágrafo atual
+    e um bloco de saída ficam em memória.
+
+    Args:
+        markdown: O texto Markdown completo, ou um iterável de linhas (por
+                  exemplo, um arquivo aberto), como em iter_markdown_to_unicode.
+        sink: O destino: um objeto com write() (arquivo, io.StringIO,
+              socket.makefile('w')), uma lista (os pedaços são acrescentados) ou
+              uma função chamada com cada pedaço.
+        options: As mesmas opções de markdown_to_unicode.
+        stats: Um ConversionStats opcional (como em markdown_to_unicode).
+
+    Returns:
+        O número de caracteres escritos; o conteúdo escrito é igual ao
+        resultado de markdown_to_unicode.
+    """
+    return _get_converter(options).convert_to(markdown, sink, stats)
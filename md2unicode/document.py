@@ -0,0 +1,343 @@
+"""
+Representação intermediária (IR): analisar uma vez, renderizar várias vezes.
+
+parse_markdown() faz a passagem de blocos e a varredura inline e guarda o
+resultado em um Document, que não depende das opções: o marcador de lista, a
+linha horizontal e o estilo dos cabeçalhos entram só na renderização. Assim,
+um mesmo Document pode ser renderizado como texto Unicode estilizado (igual a
+markdown_to_unicode), texto simples ou uma prévia em HTML, com quaisquer
+opções, sem analisar o texto de novo.
+"""
+
+import html
+import re
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from .blocks import (
+    _BLOCK_BLOCKQUOTE,
+    _BLOCK_CODE,
+    _BLOCK_CODE_FENCE,
+    _BLOCK_HEADER,
+    _BLOCK_HORIZONTAL_RULE,
+    _BLOCK_LIST,
+    _BLOCK_ORDERED_LIST,
+    _BlockState,
+)
+from .core import _LIST_INDENT, Converter, _iter_blocks
+from .inline import (
+    _INLINE_TOKEN_RE,
+    _PLAIN_KEY,
+    _STYLE_BOLD,
+    _STYLE_BOLD_ITALIC,
+    _STYLE_ITALIC,
+    _STYLE_MONOSPACE,
+    _apply_style_key,
+    _iter_runs,
+    _scan_inline,
+)
+from .styles import _to_bold, _to_monospace
+
+# --- Nós ---
+# Uma linha fora de parágrafos: (tipo de bloco, texto). Para linhas de código,
+# o texto é o conteúdo original; para as demais, a linha já pronta.
+# Um parágrafo: (_NODE_PARAGRAPH, trechos, tem_marcas), onde cada trecho é
+# (texto, chave de estilo), como em _iter_runs.
+_NODE_PARAGRAPH = 'paragraph'
+
+_Node = Tuple[Any, ...]
+_StyleKey = Tuple[Tuple[str, ...], bool]
+_Run = Tuple[str, _StyleKey]
+_ParseKey = Tuple[Optional[str], Optional[str]]
+
+# Caracteres que a varredura inline interpreta; um marcador de lista ou uma
+# linha horizontal que os contenha muda a análise e fica gravado no Document.
+_SCANNER_CHARS_RE = re.compile(r'[\\`*_~\[\]()\n]')
+
+# Marcas (uso privado) que ocupam, no texto analisado, o lugar do marcador de
+# lista, da linha horizontal e dos limites de um cabeçalho. São escolhidas
+# entre caracteres que não aparecem no texto.
+_MARK_CANDIDATES = range(0xE000, 0xF900)
+_MARK_RES: Dict[str, "re.Pattern[str]"] = {}
+
+_HTML_TAGS = {
+    _STYLE_BOLD: ('<strong>', '</strong>'),
+    _STYLE_ITALIC: ('<em>', '</em>'),
+    _STYLE_BOLD_ITALIC: ('<strong><em>', '</em></strong>'),
+    _STYLE_MONOSPACE: ('<code>', '</code>'),
+}
+
+
+class Document:
+    """
+    Um texto Markdown analisado, pronto para ser renderizado.
+
+    É imutável e pode ser guardado em cache (ou enviado a outro processo) e
+    renderizado com opções diferentes a cada vez. Só quando o marcador de lista
+    ou o caractere da linha horizontal contém caracteres de marcação inline
+    (como '*' ou '_') a análise depende deles; nesse caso eles ficam gravados
+    em `parse_key` e o Document só aceita opções com os mesmos valores.
+    """
+
+    __slots__ = ('nodes', 'marks', 'parse_key')
+
+    def __init__(self, nodes: Tuple[_Node, ...], marks: str, parse_key: _ParseKey) -> None:
+        set_attribute = object.__setattr__
+        set_attribute(self, 'nodes', nodes)
+        set_attribute(self, 'marks', marks)
+        set_attribute(self, 'parse_key', parse_key)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("Document instances are immutable.")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("Document instances are immutable.")
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (Document, (self.nodes, self.marks, self.parse_key))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Document):
+            return NotImplemented
+        return (self.nodes, self.marks, self.parse_key) == (other.nodes, other.marks, other.parse_key)
+
+    def __hash__(self) -> int:
+        return hash((self.nodes, self.marks, self.parse_key))
+
+    def __repr__(self) -> str:
+        return f"Document({len(self.nodes)} nodes)"
+
+
+def _parse_key(converter: Converter) -> _ParseKey:
+    """Os valores das opções que alteram a análise (None para os que não alteram)."""
+    prefix = converter._list_prefix
+    rule = converter._horizontal_rule
+    return (
+        None if prefix.strip() and not _SCANNER_CHARS_RE.search(prefix) else prefix,
+        None if rule.strip() and not _SCANNER_CHARS_RE.search(rule) else rule,
+    )
+
+
+def _choose_marks(texts: Sequence[str]) -> str:
+    """Quatro caracteres de uso privado que não aparecem em nenhum dos textos."""
+    marks: List[str] = []
+    for code in _MARK_CANDIDATES:
+        char = chr(code)
+        if not any(char in text for text in texts):
+            marks.append(char)
+            if len(marks) == 4:
+                return "".join(marks)
+    raise ValueError("Input uses every private-use character; it cannot be parsed into a Document.")
+
+
+def _marks_re(marks: str) -> "re.Pattern[str]":
+    pattern = _MARK_RES.get(marks)
+    if pattern is None:
+        pattern = _MARK_RES[marks] = re.compile(f'([{marks}])')
+    return pattern
+
+
+def _parse_nodes(lines: Sequence[str], marks: str, parse_key: _ParseKey,
+                 expired: Optional[Callable[[], bool]] = None) -> List[_Node]:
+    """
+    Passagem de blocos e varredura inline, como em _convert_lines, produzindo
+    nós. Com `expired`, lança _InlineExpired se o prazo acabar (veja _scan_inline).
+    """
+    bullet_mark, rule_mark, open_mark, close_mark = marks
+    prefix = bullet_mark if parse_key[0] is None else parse_key[0]
+    rule = rule_mark if parse_key[1] is None else parse_key[1]
+    marked = False
+
+    def convert_line(line: str, _: Any, state: _BlockState) -> Tuple[str, str]:
+        nonlocal marked
+        kind, content, level = state.classify(line)
+        if kind is _BLOCK_CODE or kind is _BLOCK_CODE_FENCE:
+            return kind, content
+        if kind is _BLOCK_BLOCKQUOTE:
+            return kind, "| " * level + content
+        if kind is _BLOCK_ORDERED_LIST:
+            return kind, _LIST_INDENT * level + content
+        if kind is _BLOCK_HORIZONTAL_RULE:
+            processed = rule
+        elif kind is _BLOCK_LIST:
+            processed = _LIST_INDENT * level + prefix + content
+        elif kind is _BLOCK_HEADER:
+            # O estilo dos cabeçalhos é aplicado na renderização, entre as marcas
+            processed = open_mark + content + close_mark if content else content
+        else:
+            return kind, line
+        if processed.strip():
+            # A linha entra no parágrafo atual, que passa a conter marcas
+            marked = True
+        return kind, processed
+
+    def render_paragraph(text: str) -> _Node:
+        nonlocal marked
+        if _INLINE_TOKEN_RE.search(text) is None:
+            runs: List[_Run] = [(text, _PLAIN_KEY)]
+        else:
+            pieces: List[str] = []
+            spans: List[Tuple[int, int, str]] = []
+            _scan_inline(text, 0, len(text), pieces, spans, expired)
+            runs = []
+            for run_text, key in _iter_runs(pieces, spans):
+                if runs and runs[-1][1] == key:
+                    run_text = runs.pop()[0] + run_text
+                runs.append((run_text, key))
+        node = (_NODE_PARAGRAPH, tuple(runs), marked)
+        marked = False
+        return node
+
+    return [converted if converted[0] is not None else converted[1]
+            for converted in _iter_blocks(lines, None, render_paragraph, convert_line)]
+
+
+def _fill_marks(runs: Sequence[_Run], marks: str, prefix: str, rule: str,
+                header: Optional[Callable[[str], str]]) -> List[_Run]:
+    """Substitui as marcas dos trechos pelo texto das opções, estilizando os cabeçalhos."""
+    bullet_mark, rule_mark, open_mark, _ = marks
+    split = _marks_re(marks).split
+    filled: List[_Run] = []
+    in_header = False
+    for text, key in runs:
+        parts = split(text)
+        if len(parts) == 1:
+            filled.append((header(text) if in_header and header is not None else text, key))
+            continue
+        out: List[str] = []
+        for index, part in enumerate(parts):
+            if index % 2 == 0:
+                if part:
+                    out.append(header(part) if in_header and header is not None else part)
+            elif part == bullet_mark:
+                out.append(prefix)
+            elif part == rule_mark:
+                out.append(rule)
+            else:
+                in_header = part == open_mark
+        filled.append(("".join(out), key))
+    return filled
+
+
+def _html_run(text: str, key: _StyleKey) -> str:
+    """Envolve um trecho nas tags HTML equivalentes a uma chave de estilo."""
+    maps, strike = key
+    for style in maps:
+        open_tag, close_tag = _HTML_TAGS[style]
+        text = open_tag + text + close_tag
+    if strike:
+        text = '<del>' + text + '</del>'
+    return text
+
+
+def _html_bold(text: str) -> str:
+    """Cabeçalho em negrito na prévia em HTML."""
+    return '<strong>' + text + '</strong>'
+
+
+def _resolve_converter(document: Document, options: Union[Converter, Dict[str, Any], None]) -> Converter:
+    """O conversor das opções, conferindo que ele pode renderizar o Document."""
+    if not isinstance(document, Document):
+        raise TypeError("document must be a Document (see parse_markdown).")
+    converter = options if isinstance(options, Converter) else Converter(options)
+    if _parse_key(converter) != document.parse_key:
+        raise ValueError("These list_bullet/horizontal_rule options change how the text is parsed; "
+                         "parse it again with parse_markdown(text, options).")
+    return converter
+
+
+def parse_markdown(markdown_text: str, options: Union[Converter, Dict[str, Any], None] = None) -> Document:
+    """
+    Analisa um texto Markdown uma única vez, para renderizá-lo depois.
+
+    Args:
+        markdown_text: A string contendo Markdown.
+        options: As mesmas opções de markdown_to_unicode, ou um Converter
+                 pronto. Só importam quando o marcador de lista ou o caractere
+                 da linha horizontal contém caracteres de marcação inline (ou
+                 são só espaços); nos demais casos o Document serve para
+                 quaisquer opções.
+
+    Returns:
+        Um Document imutável.
+    """
+    if not isinstance(markdown_text, str):
+        raise TypeError("Input must be a string.")
+    converter = options if isinstance(options, Converter) else Converter(options)
+    return _parse_document(markdown_text, markdown_text.splitlines(), converter)
+
+
+def _parse_document(source: str, lines: Sequence[str], converter: Converter,
+                    expired: Optional[Callable[[], bool]] = None) -> Document:
+    """Analisa as linhas (sem terminador) do texto `source` (veja _parse_nodes)."""
+    parse_key = _parse_key(converter)
+    marks = _choose_marks([source] + [value for value in parse_key if value is not None])
+    return Document(tuple(_parse_nodes(lines, marks, parse_key, expired)), marks, parse_key)
+
+
+def render_unicode(document: Document, options: Union[Converter, Dict[str, Any], None] = None) -> str:
+    """
+    Renderiza um Document como texto Unicode estilizado.
+
+    O resultado é idêntico ao de markdown_to_unicode(texto, options).
+    """
+    converter = _resolve_converter(document, options)
+    marks = document.marks
+    prefix, rule = converter._list_prefix, converter._horizontal_rule
+    header = _to_bold if converter._bold_headers else None
+    parts: List[str] = []
+    for node in document.nodes:
+        kind = node[0]
+        if kind == _NODE_PARAGRAPH:
+            runs = _fill_marks(node[1], marks, prefix, rule, header) if node[2] else node[1]
+            parts.append("".join([_apply_style_key(text, key) if key[0] or key[1] else text for text, key in runs]))
+        elif kind == _BLOCK_CODE:
+            parts.append(_to_monospace(node[1]))
+        else:
+            parts.append(node[1])
+    return "\n".join(parts)
+
+
+def render_plain(document: Document, options: Union[Converter, Dict[str, Any], None] = None) -> str:
+    """
+    Renderiza um Document como texto simples: a mesma estrutura de
+    markdown_to_unicode (marcadores, citações, linhas horizontais), sem estilos.
+    """
+    converter = _resolve_converter(document, options)
+    marks = document.marks
+    prefix, rule = converter._list_prefix, converter._horizontal_rule
+    parts: List[str] = []
+    for node in document.nodes:
+        if node[0] == _NODE_PARAGRAPH:
+            runs = _fill_marks(node[1], marks, prefix, rule, None) if node[2] else node[1]
+            parts.append("".join([text for text, _ in runs]))
+        else:
+            parts.append(node[1])
+    return "\n".join(parts)
+
+
+def render_html(document: Document, options: Union[Converter, Dict[str, Any], None] = None) -> str:
+    """
+    Renderiza um Document como uma prévia em HTML.
+
+    O texto e a disposição das linhas são os de markdown_to_unicode, dentro de
+    um <div> com `white-space: pre-wrap`; os estilos viram tags (<strong>,
+    <em>, <code>, <del>) em vez de caracteres Unicode.
+    """
+    converter = _resolve_converter(document, options)
+    marks = document.marks
+    escape = html.escape
+    prefix, rule = escape(converter._list_prefix, False), escape(converter._horizontal_rule, False)
+    header = _html_bold if converter._bold_headers else None
+    parts: List[str] = []
+    for node in document.nodes:
+        kind = node[0]
+        if kind == _NODE_PARAGRAPH:
+            runs = [(escape(text, False), key) for text, key in node[1]]
+            if node[2]:
+                runs = _fill_marks(runs, marks, prefix, rule, header)
+            parts.append("".join([_html_run(text, key) if key[0] or key[1] else text for text, key in runs]))
+        elif kind == _BLOCK_CODE and node[1]:
+            parts.append('<code>' + escape(node[1], False) + '</code>')
+        else:
+            parts.append(escape(node[1], False))
+    return '<div style="white-space: pre-wrap">' + "\n".join(parts) + '</div>'
@@ -0,0 +1,127 @@
+"""Reconversão incremental, bloco a bloco, para edição ao vivo."""
+
+from typing import Any, Dict, List, Optional, Union
+
+from .blocks import _next_fence
+from .core import Converter
+from .document import Document, _parse_document, _parse_key, render_unicode
+from .inline import _InlineExpired
+from .limits import ConversionBudget, _convert_plain_lines
+
+
+class IncrementalConverter:
+    """
+    Converte documentos reaproveitando os blocos que não mudaram desde a última
+    chamada.
+
+    O texto é dividido em blocos nas linhas em branco que ficam fora de blocos
+    de código cercados. Como nenhum outro elemento (de bloco ou inline)
+    atravessa uma linha em branco, cada bloco pode ser
+    convertido isoladamente e o resultado emendado é idêntico ao de
+    markdown_to_unicode. Blocos são guardados pelo seu conteúdo; só os blocos do
+    documento mais recente são mantidos, então a memória acompanha o tamanho do
+    documento atual. Uma instância não deve ser compartilhada entre threads.
+
+    Cada bloco é guardado também já analisado (um Document), o que não depende
+    das opções: ao trocar as opções, os blocos são apenas renderizados de novo.
+    """
+
+    def __init__(self, options: Union[Converter, Dict[str, Any], None] = None) -> None:
+        self._converter = options if isinstance(options, Converter) else Converter(options)
+        self._blocks: Dict[str, str] = {}
+        self._documents: Dict[str, Document] = {}
+        self.reused_blocks = 0
+        self.rerendered_blocks = 0
+        self.converted_blocks = 0
+
+    def convert(self, markdown_text: str, options: Union[Converter, Dict[str, Any], None] = None,
+                budget: Optional[ConversionBudget] = None) -> str:
+        """
+        Converte o texto como markdown_to_unicode, reconvertendo apenas os blocos
+        alterados.
+
+        Args:
+            markdown_text: A string contendo Markdown.
+            options: Se informado e diferente das opções atuais, substitui as
+                     opções da instância; os blocos guardados são renderizados
+                     de novo com elas, sem nova análise.
+            budget: Um ConversionBudget opcional. Depois que o prazo acaba, os
+                    blocos que ainda precisariam ser convertidos saem sem estilos
+                    inline, não são guardados e são contados em
+                    `budget.degraded_blocks`; blocos já conhecidos continuam
+                    sendo reaproveitados. O prazo também é consultado durante
+                    a varredura inline de um bloco grande.
+
+        Returns:
+            A string convertida com caracteres Unicode.
+        """
+        if not isinstance(markdown_text, str):
+            raise TypeError("Input must be a string.")
+        if options is not None:
+            converter = options if isinstance(options, Converter) else Converter(options)
+            if converter != self._converter:
+                if _parse_key(converter) != _parse_key(self._converter):
+                    self._documents = {}
+                self._converter = converter
+                self._blocks = {}
+        converter = self._converter
+
+        previous = self._blocks
+        previous_documents = self._documents
+        current: Dict[str, str] = {}
+        current_documents: Dict[str, Document] = {}
+        reused = rerendered = converted = 0
+        parts: List[str] = []
+        block: List[str] = []
+        expired = budget.expired if budget is not None else None
+
+        def flush() -> None:
+            nonlocal reused, rerendered, converted
+            source = "\n".join(block)
+            result = current.get(source)
+            if result is None:
+                result = previous.get(source)
+                document = previous_documents.get(source)
+                if result is None:
+                    try:
+                        if expired is not None and expired():
+                            raise _InlineExpired
+                        if document is None:
+                            document = _parse_document(source, block, converter, expired)
+                            converted += 1
+                        else:
+                            rerendered += 1
+                    except _InlineExpired:
+                        budget.degraded_blocks += 1
+                        parts.append(_convert_plain_lines(block, converter))
+                        return
+                    result = render_unicode(document, converter)
+                else:
+                    reused += 1
+                current[source] = result
+                if document is not None:
+                    current_documents[source] = document
+            else:
+                reused += 1
+            parts.append(result)
+
+        fence = None
+        for line in markdown_text.splitlines():
+            if fence is not None or line.strip():
+                block.append(line)
+                fence = _next_fence(line, fence)
+                continue
+            if block:
+                flush()
+                block = []
+            # Linhas em branco passam inalteradas pela conversão
+            parts.append(line)
+        if block:
+            flush()
+
+        self._blocks = current
+        self._documents = current_documents
+        self.reused_blocks = reused
+        self.rerendered_blocks = rerendered
+        self.converted_blocks = converted
+        return "\n".join(parts)
@@ -0,0 +1,367 @@
+"""Conversão de elementos inline (negrito, itálico, código, riscado, links)."""
+
+import re
+from operator import itemgetter
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .styles import (
+    _BOLD_ITALIC_STYLE,
+    _BOLD_STYLE,
+    _ITALIC_STYLE,
+    _MONOSPACE_STYLE,
+    _VECTORIZE_MIN_CHARS,
+    _apply_vectorized,
+    _style_table,
+    _to_strikethrough,
+)
+
+# --- Motor Inline (passagem única com pilha de delimitadores) ---
+_STYLE_BOLD = 'bold'
+_STYLE_ITALIC = 'italic'
+_STYLE_BOLD_ITALIC = 'bold_italic'  # só em chaves: negrito e itálico combinados
+_STYLE_MONOSPACE = 'monospace'
+_STYLE_STRIKETHROUGH = 'strikethrough'
+_STYLE_LINK = 'link'  # não altera o texto; só marca o texto do link (contagem)
+
+# Estilo do registro usado por cada estilo inline (backend vetorizado)
+_REGISTRY_STYLES = {
+    _STYLE_BOLD: _BOLD_STYLE,
+    _STYLE_ITALIC: _ITALIC_STYLE,
+    _STYLE_BOLD_ITALIC: _BOLD_ITALIC_STYLE,
+    _STYLE_MONOSPACE: _MONOSPACE_STYLE,
+}
+
+# Um único padrão localiza o próximo token inline: escape, crase,
+# sequência de delimitadores (*, _, ~) ou abertura de link.
+_INLINE_TOKEN_RE = re.compile(r'\\[`*_]|`|\*+|_+|~+|\[')
+
+# Span simples, sem nenhum outro token dentro: `*a*`, `__a__`, `~~a~~`, etc.
+# _INLINE_SCAN_RE tenta primeiro casar um span simples inteiro (o grupo do
+# conteúdo indica o tipo) e, se não houver, encontra o mesmo token que
+# _INLINE_TOKEN_RE; assim cada span simples custa uma única busca.
+_SIMPLE_SPANS = (
+    ('*', 2, _STYLE_BOLD),
+    ('*', 1, _STYLE_ITALIC),
+    ('_', 2, _STYLE_BOLD),
+    ('_', 1, _STYLE_ITALIC),
+    ('~', 2, _STYLE_STRIKETHROUGH),
+)
+_INLINE_SCAN_RE = re.compile('|'.join(
+    [rf'{re.escape(char * length)}([^`*_~\[\\]+){re.escape(char * length)}(?!{re.escape(char)})'
+     for char, length, _ in _SIMPLE_SPANS] + [_INLINE_TOKEN_RE.pattern]))
+# Por grupo do conteúdo em _INLINE_SCAN_RE: (estilo, tamanho do delimitador)
+_SIMPLE_SPAN_GROUPS = {group: (style, length) for group, (_, length, style) in enumerate(_SIMPLE_SPANS, start=1)}
+
+# Negrito dentro de itálico (ou o contrário) vira negrito-itálico
+_STYLE_PARTNERS = {_STYLE_BOLD: _STYLE_ITALIC, _STYLE_ITALIC: _STYLE_BOLD}
+
+# Chave de estilo: (estilos de mapeamento do mais interno ao mais externo, riscado)
+_PLAIN_KEY: Tuple[Tuple[str, ...], bool] = ((), False)
+_KEY_CACHE: Dict[Tuple[Tuple[Tuple[str, ...], bool], str], Tuple[Tuple[str, ...], bool]] = {}
+
+# Tabela de tradução de cada combinação de estilos: os estilos só mapeiam
+# caracteres ASCII, então o primeiro estilo que mapeia um caractere prevalece.
+_KEY_TABLES: Dict[Tuple[str, ...], Dict[int, str]] = {}
+
+# Chave de ordenação dos spans pelo início (em C, sem uma lambda por span)
+_SPAN_START = itemgetter(0)
+
+# Com um prazo, a varredura o consulta a cada tantos caracteres percorridos
+_EXPIRY_CHECK_CHARS = 16 * 1024
+
+
+class _InlineExpired(Exception):
+    """O prazo passado a _scan_inline acabou no meio da varredura."""
+
+
+def _find_code_close(text: str, start: int, end: int) -> int:
+    """Retorna a posição da crase de fechamento não escapada em text[start:end], ou -1."""
+    close = text.find('`', start, end)
+    while close != -1 and text[close - 1] == '\\':
+        close = text.find('`', close + 1, end)
+    return close
+
+
+def _scan_inline(text: str, start: int, end: int, pieces: List[str], spans: List[Tuple[int, int, str]],
+                 expired: Optional[Callable[[], bool]] = None) -> None:
+    """
+    Varre text[start:end] uma única vez da esquerda para a direita.
+
+    O texto é acumulado em `pieces` e cada ênfase reconhecida vira um span
+    (início, fim, estilo) sobre índices de `pieces`. Delimitadores são casados
+    assim que aparecem, usando uma pilha no estilo CommonMark (inclusive a regra
+    do múltiplo de 3), o que permite ênfase aninhada como `**a _b_**`.
+    Código inline e links não atravessam quebras de linha.
+
+    Com `expired`, o prazo é consultado a cada _EXPIRY_CHECK_CHARS caracteres e
+    _InlineExpired é lançada quando ele acaba (um parágrafo enorme não escapa
+    do orçamento da conversão).
+    """
+    stack: List[List[Any]] = []  # [caractere, comprimento original, restante, índice em pieces]
+    bottoms: Dict[Tuple[str, int], int] = {}  # limite inferior de busca após falhas (tempo linear)
+    pending = {'*': 0, '_': 0, '~': 0}  # aberturas na pilha, por caractere
+    eol = code_fail_eol = link_fail_eol = -1
+    pos = start
+    search = _INLINE_TOKEN_RE.search
+    scan = _INLINE_SCAN_RE.search
+    check_at = start + _EXPIRY_CHECK_CHARS if expired is not None else end + 1
+
+    while True:
+        if pos >= check_at:
+            if expired():
+                raise _InlineExpired
+            check_at = pos + _EXPIRY_CHECK_CHARS
+        match = scan(text, pos, end)
+        if match is None:
+            if pos < end:
+                pieces.append(text[pos:end])
+            return
+        token_start = match.start()
+        if token_start > pos:
+            pieces.append(text[pos:token_start])
+        group = match.lastindex
+        if group is not None:
+            # Span simples: se nenhuma abertura com este caractere está
+            # pendente, ele é casado de uma vez, exatamente como a pilha faria;
+            # senão, só a sequência de abertura é tratada como token.
+            char = text[token_start]
+            if not pending[char]:
+                spans.append((len(pieces), len(pieces) + 1, _SIMPLE_SPAN_GROUPS[group][0]))
+                pieces.append(match.group(group))
+                pos = match.end()
+                continue
+            pos = token_start + _SIMPLE_SPAN_GROUPS[group][1]
+        else:
+            pos = match.end()
+        token = text[token_start:pos]
+        char = token[0]
+
+        # Escape: o caractere seguinte é mantido literalmente (junto com a barra)
+        if char == '\\':
+            pieces.append(token)
+            continue
+
+        # Código inline e links: procurados apenas até o fim da linha atual
+        if char == '`' or char == '[':
+            if token_start > eol:
+                eol = text.find('\n', token_start, end)
+                if eol == -1:
+                    eol = end
+            if char == '`':
+                if code_fail_eol != eol:
+                    close = _find_code_close(text, token_start + 2, eol)
+                    if close != -1:
+                        spans.append((len(pieces), len(pieces) + 1, _STYLE_MONOSPACE))
+                        pieces.append(text[token_start + 1:close])
+                        pos = close + 1
+                        continue
+                    code_fail_eol = eol
+            elif link_fail_eol != eol:
+                middle = text.find('](', token_start + 2, eol)
+                close = text.find(')', middle + 3, eol) if middle != -1 else -1
+                if close != -1:
+                    # Mantém apenas o texto do link, processado no seu próprio escopo
+                    link_start = len(pieces)
+                    if search(text, token_start + 1, middle) is None:
+                        pieces.append(text[token_start + 1:middle])
+                    else:
+                        _scan_inline(text, token_start + 1, middle, pieces, spans, expired)
+                    spans.append((link_start, len(pieces), _STYLE_LINK))
+                    pos = close + 1
+                    continue
+                link_fail_eol = eol
+            pieces.append(char)
+            continue
+
+        # Sequência de delimitadores de ênfase (*, _) ou riscado (~~)
+        length = len(token)
+        if char == '~' and length < 2:
+            pieces.append(token)
+            continue
+        if length <= 2 and stack:
+            # Caso comum (`*a*`, `**a**`, `~~a~~`): o topo da pilha é uma abertura
+            # intacta idêntica; o par é casado por inteiro, sem busca.
+            top = stack[-1]
+            if top[0] == char and top[1] == length and top[2] == length:
+                spans.append((top[3] + 1, len(pieces), _STYLE_STRIKETHROUGH if char == '~'
+                              else _STYLE_BOLD if length == 2 else _STYLE_ITALIC))
+                pieces[top[3]] = ''
+                stack.pop()
+                pending[char] -= 1
+                depth = len(stack)
+                for bottom_key, value in bottoms.items():
+                    if value > depth:
+                        bottoms[bottom_key] = depth
+                continue
+        minimum = 2 if char == '~' else 1
+        key = (char, length % 3 if char != '~' else 0)
+        remaining = length
+        bottom = min(bottoms.get(key, 0), len(stack))
+        index = len(stack) - 1
+        while remaining >= minimum and index >= bottom:
+            opener = stack[index]
+            if opener[0] != char or opener[2] < minimum:
+                index -= 1
+                continue
+            if char == '~':
+                use, style = 2, _STYLE_STRIKETHROUGH
+            else:
+                total = opener[1] + length
+                if total % 3 == 0 and (opener[1] % 3 or length % 3):
+                    index -= 1
+                    continue
+                use = 2 if opener[2] >= 2 and remaining >= 2 else 1
+                style = _STYLE_BOLD if use == 2 else _STYLE_ITALIC
+            spans.append((opener[3] + 1, len(pieces), style))
+            opener[2] -= use
+            remaining -= use
+            pieces[opener[3]] = char * opener[2]
+            # Delimitadores entre a abertura e o fechamento ficam literais; a
+            # própria abertura sai da pilha se não puder mais casar
+            cut = index + 1 if opener[2] >= minimum else index
+            for entry in stack[cut:]:
+                pending[entry[0]] -= 1
+            del stack[cut:]
+            for bottom_key, value in bottoms.items():
+                if value > len(stack):
+                    bottoms[bottom_key] = len(stack)
+            bottom = min(bottom, len(stack))
+            index = len(stack) - 1
+        if index < bottom:
+            bottoms[key] = len(stack)
+        if remaining:
+            pieces.append(char * remaining)
+            if remaining >= minimum:
+                stack.append([char, length, remaining, len(pieces) - 1])
+                pending[char] += 1
+
+
+def _style_key(parent: Tuple[Tuple[str, ...], bool], style: str) -> Tuple[Tuple[str, ...], bool]:
+    """Combina o estilo de um span com a chave do span que o contém."""
+    cache_key = (parent, style)
+    key = _KEY_CACHE.get(cache_key)
+    if key is None:
+        maps, strike = parent
+        if style == _STYLE_LINK:
+            key = parent
+        elif style == _STYLE_STRIKETHROUGH:
+            key = (maps, True)
+        elif style in _STYLE_PARTNERS and (_STYLE_BOLD_ITALIC in maps or _STYLE_PARTNERS[style] in maps):
+            # Combina com o estilo complementar, mantendo a posição dele
+            partner = _STYLE_PARTNERS[style]
+            key = (tuple(_STYLE_BOLD_ITALIC if m == partner else m for m in maps if m != style), strike)
+        else:
+            key = ((style,) + tuple(m for m in maps if m != style), strike)
+        _KEY_CACHE[cache_key] = key
+    return key
+
+
+def _apply_style_key(text: str, key: Tuple[Tuple[str, ...], bool]) -> str:
+    """Aplica os estilos de uma chave com uma única tradução (mais o riscado)."""
+    maps, strike = key
+    if len(text) >= _VECTORIZE_MIN_CHARS:
+        # Trecho grande: uma codificação e uma decodificação só
+        result = _apply_vectorized(text, tuple(_REGISTRY_STYLES[style] for style in maps), strike)
+        if result is not None:
+            return result
+    if maps:
+        table = _KEY_TABLES.get(maps)
+        if table is None:
+            table = {}
+            for style in maps:
+                for code, styled in _style_table(_REGISTRY_STYLES[style]).items():
+                    table.setdefault(code, styled)
+            _KEY_TABLES[maps] = table
+        text = text.translate(table)
+    return _to_strikethrough(text) if strike else text
+
+
+def _render_inline(text: str, expired: Optional[Callable[[], bool]] = None) -> str:
+    """
+    Converte os elementos inline de um parágrafo em uma única passagem.
+
+    Com `expired`, lança _InlineExpired se o prazo acabar antes da aplicação
+    dos estilos (veja _scan_inline).
+    """
+    if _INLINE_TOKEN_RE.search(text) is None:
+        return text
+    pieces: List[str] = []
+    spans: List[Tuple[int, int, str]] = []
+    _scan_inline(text, 0, len(text), pieces, spans, expired)
+    if expired is not None and expired():
+        raise _InlineExpired
+    return _render_spans(pieces, spans)
+
+
+def _render_inline_instrumented(text: str, stats: Any) -> str:
+    """Como _render_inline, registrando tempos e contadores em um ConversionStats."""
+    started = perf_counter()
+    pieces: List[str] = []
+    spans: List[Tuple[int, int, str]] = []
+    if _INLINE_TOKEN_RE.search(text) is None:
+        pieces.append(text)
+    else:
+        _scan_inline(text, 0, len(text), pieces, spans)
+    scanned = perf_counter()
+    result = _render_spans(pieces, spans, stats)
+    stats.inline_scan_seconds += scanned - started
+    stats.inline_render_seconds += perf_counter() - scanned
+    counts = stats.construct_counts
+    for _, _, style in spans:
+        counts[style] = counts.get(style, 0) + 1
+    return result
+
+
+def _render_spans(pieces: List[str], spans: List[Tuple[int, int, str]], stats: Any = None) -> str:
+    """Aplica os estilos dos spans aos pedaços produzidos por _scan_inline."""
+    if not spans:
+        return "".join(pieces)
+    output: List[str] = []
+    for segment, key in _iter_runs(pieces, spans):
+        if key is not _PLAIN_KEY:
+            if stats is not None:
+                stats.restyled_characters += len(segment)
+            segment = _apply_style_key(segment, key)
+        output.append(segment)
+    return "".join(output)
+
+
+def _iter_runs(pieces: Sequence[str],
+               spans: Sequence[Tuple[int, int, str]]) -> Iterator[Tuple[str, Tuple[Tuple[str, ...], bool]]]:
+    """
+    Percorre os trechos de texto de um mesmo estilo: (texto, chave de estilo).
+
+    Trechos sem estilo têm a chave _PLAIN_KEY (o próprio objeto).
+    """
+    # Spans formam uma hierarquia (nunca se cruzam); para um mesmo início,
+    # o span criado por último é o mais externo. Ordenados pelo início (a
+    # ordenação é estável, então a lista invertida põe o externo primeiro),
+    # cada span abre dentro do último ainda ativo; os pedaços entre duas
+    # fronteiras compartilham o mesmo estilo e são estilizados de uma vez.
+    active: List[Tuple[int, Tuple[Tuple[str, ...], bool]]] = []
+    key = _PLAIN_KEY
+    position = 0
+    for span_start, span_end, style in sorted(reversed(spans), key=_SPAN_START):
+        if span_start >= span_end:
+            continue
+        while active and active[-1][0] <= span_start:
+            boundary = active.pop()[0]
+            if boundary > position:
+                yield "".join(pieces[position:boundary]), key
+                position = boundary
+            key = active[-1][1] if active else _PLAIN_KEY
+        if span_start > position:
+            yield "".join(pieces[position:span_start]), key
+            position = span_start
+        child = _KEY_CACHE.get((key, style))
+        key = child if child is not None else _style_key(key, style)
+        active.append((span_end, key))
+    while active:
+        boundary = active.pop()[0]
+        if boundary > position:
+            yield "".join(pieces[position:boundary]), key
+            position = boundary
+        key = active[-1][1] if active else _PLAIN_KEY
+    if position < len(pieces):
+        yield "".join(pieces[position:]), _PLAIN_KEY
@@ -0,0 +1,357 @@
+"""
+Conversão em massa de arquivos JSONL, retomável após falhas.
+
+Execute com `python -m md2unicode.jsonl entrada.jsonl saida.jsonl --field body`.
+
+Cada linha é um objeto JSON; o campo escolhido é convertido e o registro é
+escrito na saída, na mesma ordem. O arquivo é lido e escrito em fluxo (só os
+lotes em andamento ficam em memória), textos idênticos são convertidos uma
+única vez (pelo hash do conteúdo) e as conversões são distribuídas entre
+processos. De tempos em tempos o progresso é gravado em um arquivo de
+checkpoint; se o processo for interrompido, a próxima execução continua da
+última linha confirmada.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from collections import OrderedDict, deque
+from typing import IO, Any, Deque, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .batch import _convert_chunk, _init_worker
+from .core import Converter
+
+_CHECKPOINT_VERSION = 1
+
+# Registro que não é convertido (linha em branco, campo ausente ou não textual)
+_PASSTHROUGH = -1
+# Texto repetido de um lote anterior: o resultado vem do cache de duplicatas
+_FROM_CACHE = -2
+
+
+class JsonlReport:
+    """Contadores de uma execução de convert_jsonl."""
+
+    def __init__(self) -> None:
+        self.lines = 0
+        self.converted = 0
+        self.duplicates = 0
+        self.skipped = 0
+        self.resumed_lines = 0
+        self.seconds = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Representação plana, pronta para registrar em log."""
+        return {
+            'lines': self.lines,
+            'converted': self.converted,
+            'duplicates': self.duplicates,
+            'skipped': self.skipped,
+            'resumed_lines': self.resumed_lines,
+            'seconds': self.seconds,
+        }
+
+    def __repr__(self) -> str:
+        return f"JsonlReport({self.as_dict()!r})"
+
+
+class _Chunk:
+    """Um lote de linhas lidas: o que cada uma precisa e os textos a converter."""
+
+    def __init__(self, lines: List[bytes], end_offset: int) -> None:
+        self.lines = lines
+        self.end_offset = end_offset
+        # Por linha: (registro, índice em `texts`, _PASSTHROUGH ou _FROM_CACHE, hash)
+        self.slots: List[Tuple[Any, int, bytes]] = []
+        self.texts: List[str] = []
+
+
+def _content_hash(text: str) -> bytes:
+    return hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+
+def _dump_record(record: Dict[str, Any]) -> bytes:
+    """Serializa um registro em uma linha JSONL (UTF-8 legível, sem escapes)."""
+    try:
+        return json.dumps(record, ensure_ascii=False).encode('utf-8') + b'\n'
+    except UnicodeEncodeError:
+        # Surrogates isolados não existem em UTF-8; só então os escapes \\u são usados
+        return json.dumps(record).encode('ascii') + b'\n'
+
+
+def _write_checkpoint(path: str, state: Dict[str, Any]) -> None:
+    """Grava o checkpoint de forma atômica (arquivo temporário + os.replace)."""
+    temporary = f"{path}.tmp"
+    with open(temporary, 'w', encoding='utf-8') as handle:
+        json.dump(state, handle)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(temporary, path)
+
+
+def _read_checkpoint(path: str, expected: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Lê um checkpoint existente, conferindo que ele é da mesma tarefa."""
+    try:
+        with open(path, encoding='utf-8') as handle:
+            state = json.load(handle)
+    except FileNotFoundError:
+        return None
+    for key, value in expected.items():
+        if state.get(key) != value:
+            raise ValueError(f"checkpoint {path!r} belongs to a different job ({key} differs); "
+                             f"remove it or pass resume=False.")
+    return state
+
+
+def convert_jsonl(
+    input_path: str,
+    output_path: str,
+    field: str = 'body',
+    options: Union[Converter, Dict[str, Any], None] = None,
+    output_field: Optional[str] = None,
+    workers: Optional[int] = None,
+    chunksize: int = 512,
+    checkpoint_path: Optional[str] = None,
+    checkpoint_every: int = 50_000,
+    resume: bool = True,
+    dedup_entries: int = 100_000,
+) -> JsonlReport:
+    """
+    Converte o campo `field` de cada registro de um arquivo JSONL.
+
+    A saída tem uma linha por linha da entrada, na mesma ordem. Linhas em
+    branco, registros que não são objetos e registros sem o campo (ou com um
+    valor que não é texto) são copiados sem alteração.
+
+    Args:
+        input_path: Arquivo JSONL de entrada.
+        output_path: Arquivo JSONL de saída.
+        field: Campo com o texto Markdown.
+        options: As mesmas opções de markdown_to_unicode, ou um Converter pronto.
+        output_field: Campo onde gravar o resultado (padrão: o próprio `field`).
+        workers: Número de processos (padrão: os.cpu_count()). Com 1, converte
+                 no próprio processo, sem pool.
+        chunksize: Linhas por lote enviado a um worker.
+        checkpoint_path: Arquivo de checkpoint (padrão: saída + '.checkpoint').
+                 É removido quando a conversão termina.
+        checkpoint_every: Linhas entre dois checkpoints.
+        resume: Se True e houver um checkpoint desta mesma tarefa, continua de
+                onde ele parou; se False, recomeça do início.
+        dedup_entries: Quantos resultados recentes ficam guardados para
+                reaproveitar em textos repetidos.
+
+    Returns:
+        Um JsonlReport com os contadores da execução.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1.")
+    if checkpoint_every < 1:
+        raise ValueError("checkpoint_every must be at least 1.")
+    if dedup_entries < 1:
+        raise ValueError("dedup_entries must be at least 1.")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be at least 1.")
+
+    converter = options if isinstance(options, Converter) else Converter(options)
+    target_field = field if output_field is None else output_field
+    if checkpoint_path is None:
+        checkpoint_path = f"{output_path}.checkpoint"
+
+    job = {
+        'version': _CHECKPOINT_VERSION,
+        'input': os.path.abspath(input_path),
+        'field': field,
+        'output_field': target_field,
+        'options': [list(item) for item in converter.options_key],
+    }
+
+    report = JsonlReport()
+    started = time.perf_counter()
+    # Hash do texto -> resultado, para textos repetidos (os mais antigos saem primeiro)
+    seen: "OrderedDict[bytes, str]" = OrderedDict()
+
+    def prepare(chunk: _Chunk, first_line: int) -> None:
+        """Interpreta as linhas do lote e separa os textos inéditos."""
+        in_chunk: Dict[bytes, int] = {}
+        for number, line in enumerate(chunk.lines, first_line):
+            if not line.strip():
+                chunk.slots.append((None, _PASSTHROUGH, b''))
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as error:
+                raise ValueError(f"{input_path}:{number}: invalid JSON ({error})") from None
+            text = record.get(field) if isinstance(record, dict) else None
+            if not isinstance(text, str):
+                chunk.slots.append((None, _PASSTHROUGH, b''))
+                continue
+            digest = _content_hash(text)
+            index = in_chunk.get(digest)
+            if index is None and digest in seen:
+                index = _FROM_CACHE
+            if index is None:
+                index = in_chunk[digest] = len(chunk.texts)
+                chunk.texts.append(text)
+            else:
+                report.duplicates += 1
+            chunk.slots.append((record, index, digest))
+
+    def finish(chunk: _Chunk, results: List[Union[str, Exception]]) -> bytes:
+        """Monta as linhas de saída do lote, na ordem da entrada."""
+        out: List[bytes] = []
+        for line, (record, index, digest) in zip(chunk.lines, chunk.slots):
+            if index == _PASSTHROUGH:
+                if line.strip():
+                    report.skipped += 1
+                out.append(line if line.endswith(b'\n') else line + b'\n')
+                continue
+            if index == _FROM_CACHE:
+                result = seen.get(digest)
+                if result is None:
+                    # Descartado do cache enquanto o lote esperava: converte aqui
+                    result = converter.convert(record[field])
+                else:
+                    seen.move_to_end(digest)
+            else:
+                result = results[index]
+                if isinstance(result, Exception):
+                    raise result
+                seen[digest] = result
+                if len(seen) > dedup_entries:
+                    seen.popitem(last=False)
+            record[target_field] = result
+            out.append(_dump_record(record))
+        report.converted += len(chunk.texts)
+        report.lines += len(chunk.lines)
+        return b''.join(out)
+
+    with open(input_path, 'rb') as source:
+        state = _read_checkpoint(checkpoint_path, job) if resume else None
+        if state is not None:
+            source.seek(state['input_offset'])
+            output: IO[bytes] = open(output_path, 'r+b')
+            output.truncate(state['output_offset'])
+            output.seek(state['output_offset'])
+            report.resumed_lines = state['lines']
+        else:
+            output = open(output_path, 'wb')
+
+        offset = source.tell()
+        line_number = report.resumed_lines + 1
+        pending_checkpoint = 0
+
+        def save_checkpoint() -> None:
+            output.flush()
+            os.fsync(output.fileno())
+            _write_checkpoint(checkpoint_path, dict(job, input_offset=offset, output_offset=output.tell(),
+                                                    lines=report.resumed_lines + report.lines))
+
+        def read_chunks() -> Iterator[_Chunk]:
+            nonlocal line_number
+            position = source.tell()
+            while True:
+                lines: List[bytes] = []
+                for line in source:
+                    lines.append(line)
+                    position += len(line)
+                    if len(lines) == chunksize:
+                        break
+                if not lines:
+                    return
+                chunk = _Chunk(lines, position)
+                prepare(chunk, line_number)
+                line_number += len(lines)
+                yield chunk
+
+        def commit(chunk: _Chunk, results: List[Union[str, Exception]]) -> None:
+            nonlocal offset, pending_checkpoint
+            output.write(finish(chunk, results))
+            offset = chunk.end_offset
+            pending_checkpoint += len(chunk.lines)
+            if pending_checkpoint >= checkpoint_every:
+                save_checkpoint()
+                pending_checkpoint = 0
+
+        try:
+            if workers == 1:
+                _init_worker(converter)
+                for chunk in read_chunks():
+                    commit(chunk, _convert_chunk(chunk.texts))
+            else:
+                # Importado sob demanda, como em batch.py
+                from concurrent.futures import ProcessPoolExecutor
+
+                with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                         initargs=(converter,)) as executor:
+                    # Executor.map leria o arquivo inteiro de uma vez; a janela
+                    # limita os lotes em andamento a dois por worker.
+                    window: Deque[Tuple[_Chunk, Any]] = deque()
+                    for chunk in read_chunks():
+                        window.append((chunk, executor.submit(_convert_chunk, chunk.texts)))
+                        if len(window) >= 2 * workers:
+                            done, future = window.popleft()
+                            commit(done, future.result())
+                    while window:
+                        done, future = window.popleft()
+                        commit(done, future.result())
+        except BaseException:
+            # Confirma o que já foi escrito, para a próxima execução retomar daqui
+            if report.lines:
+                save_checkpoint()
+            output.close()
+            raise
+
+        output.close()
+
+    try:
+        os.remove(checkpoint_path)
+    except FileNotFoundError:
+        pass
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    # Importado aqui para não carregar a CLI ao importar o pacote
+    from .cli import _add_conversion_arguments, _options_from_args
+
+    parser = argparse.ArgumentParser(prog='python -m md2unicode.jsonl',
+                                     description='Converte um campo Markdown de cada registro de um arquivo JSONL.')
+    parser.add_argument('input', help='arquivo JSONL de entrada')
+    parser.add_argument('output', help='arquivo JSONL de saída')
+    parser.add_argument('--field', default='body', help="campo com o texto Markdown (padrão: 'body')")
+    parser.add_argument('--output-field', help='campo onde gravar o resultado (padrão: o próprio --field)')
+    parser.add_argument('--workers', type=int, default=None, help='processos de conversão (padrão: núcleos)')
+    parser.add_argument('--chunksize', type=int, default=512, help='linhas por lote (padrão: 512)')
+    parser.add_argument('--checkpoint', help='arquivo de checkpoint (padrão: saída + .checkpoint)')
+    parser.add_argument('--checkpoint-every', type=int, default=50_000, help='linhas entre checkpoints')
+    parser.add_argument('--restart', action='store_true', help='ignora um checkpoint existente')
+    _add_conversion_arguments(parser)
+    args = parser.parse_args(argv)
+
+    try:
+        report = convert_jsonl(args.input, args.output, args.field, _options_from_args(args),
+                               output_field=args.output_field, workers=args.workers,
+                               chunksize=args.chunksize, checkpoint_path=args.checkpoint,
+                               checkpoint_every=args.checkpoint_every, resume=not args.restart)
+    except OSError as error:
+        parser.exit(1, f"md2unicode.jsonl: {error.filename}: {error.strerror}\n")
+    except ValueError as error:
+        parser.exit(1, f"md2unicode.jsonl: {error}\n")
+
+    elapsed = max(report.seconds, 1e-9)
+    sys.stderr.write(
+        f"{report.lines} linhas em {elapsed:.3f} s ({report.lines / elapsed:,.0f} linhas/s): "
+        f"{report.converted} convertidas, {report.duplicates} repetidas, {report.skipped} ignoradas"
+        + (f", retomado após {report.resumed_lines} linhas" if report.resumed_lines else '') + "\n"
+    )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
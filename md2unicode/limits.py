@@ -0,0 +1,164 @@
+"""Limites de entrada e orçamento de tempo para conversões de textos não confiáveis."""
+
+from time import monotonic
+from typing import Any, Callable, Dict, Iterable, Optional, Union
+
+from .blocks import _BlockState
+from .core import (
+    Converter,
+    _TextSink,
+    _convert_block_line,
+    _convert_lines,
+    _iter_source_lines,
+    _iter_text_lines,
+    _write_chunks,
+)
+from .inline import _InlineExpired, _render_inline
+
+
+class InputTooLargeError(ValueError):
+    """O texto excede o tamanho máximo permitido."""
+
+
+class ConversionTimeoutError(TimeoutError):
+    """
+    O orçamento de tempo acabou antes do fim da conversão.
+
+    `fallback` contém a saída degradada: os trechos convertidos até o fim do
+    prazo, seguidos do restante apenas com os elementos de bloco (sem estilos
+    inline).
+    """
+
+    def __init__(self, message: str, fallback: str) -> None:
+        super().__init__(message)
+        self.fallback = fallback
+
+
+class ConversionBudget:
+    """
+    Prazo cooperativo de uma conversão.
+
+    A conversão consulta `expired()` antes de cada parágrafo (ou bloco, no
+    IncrementalConverter) e, durante a varredura inline, a cada poucos
+    milhares de caracteres; depois que o prazo acaba, ou que `cancel()` é
+    chamado de outra thread, o parágrafo interrompido e os seguintes saem sem
+    estilos inline e são contados em `degraded_blocks`.
+
+    Args:
+        seconds: Tempo disponível, contado a partir da criação (None: sem prazo).
+    """
+
+    def __init__(self, seconds: Optional[float] = None) -> None:
+        self.deadline = None if seconds is None else monotonic() + seconds
+        self.cancelled = False
+        self.degraded_blocks = 0
+
+    def cancel(self) -> None:
+        """Pede o fim antecipado da conversão (seguro entre threads)."""
+        self.cancelled = True
+
+    def expired(self) -> bool:
+        """True se o prazo acabou ou a conversão foi cancelada."""
+        if self.cancelled:
+            return True
+        if self.deadline is not None and monotonic() >= self.deadline:
+            self.cancelled = True
+            return True
+        return False
+
+
+def check_input_size(markdown_text: str, max_input_chars: Optional[int]) -> None:
+    """Lança InputTooLargeError se o texto tiver mais de `max_input_chars` caracteres."""
+    if max_input_chars is not None and len(markdown_text) > max_input_chars:
+        raise InputTooLargeError(
+            f"Input has {len(markdown_text)} characters; the limit is {max_input_chars}.")
+
+
+def _convert_plain_lines(lines: Iterable[str], converter: Converter) -> str:
+    """Converte só os elementos de bloco das linhas, deixando o texto sem estilos inline."""
+    state = _BlockState()
+    return "\n".join([_convert_block_line(line, converter, state)[1] for line in lines])
+
+
+def _budgeted_renderer(budget: ConversionBudget) -> Callable[[str], str]:
+    """render_paragraph de _convert_lines que degrada para texto simples quando o prazo acaba."""
+    def render_paragraph(text: str) -> str:
+        if not budget.expired():
+            try:
+                return _render_inline(text, budget.expired)
+            except _InlineExpired:
+                pass
+        budget.degraded_blocks += 1
+        return text
+
+    return render_paragraph
+
+
+def convert_with_limits(
+    markdown_text: str,
+    options: Union[Converter, Dict[str, Any], None] = None,
+    max_input_chars: Optional[int] = None,
+    time_budget: Optional[float] = None,
+    budget: Optional[ConversionBudget] = None,
+    fallback: bool = True,
+) -> str:
+    """
+    Converte como markdown_to_unicode, com limite de tamanho e de tempo.
+
+    Args:
+        markdown_text: A string contendo Markdown.
+        options: As mesmas opções de markdown_to_unicode, ou um Converter pronto.
+        max_input_chars: Tamanho máximo aceito (InputTooLargeError acima disso).
+        time_budget: Segundos disponíveis para a conversão.
+        budget: Um ConversionBudget já criado (por exemplo, para cancelá-lo de
+                outra thread); tem precedência sobre `time_budget`.
+        fallback: Se True (padrão), quando o prazo acaba o restante do texto é
+                  devolvido sem estilos inline. Se False, lança
+                  ConversionTimeoutError, com a saída degradada em `fallback`.
+
+    Returns:
+        A string convertida com caracteres Unicode.
+    """
+    if not isinstance(markdown_text, str):
+        raise TypeError("Input must be a string.")
+    check_input_size(markdown_text, max_input_chars)
+    converter = options if isinstance(options, Converter) else Converter(options)
+    if budget is None:
+        budget = ConversionBudget(time_budget)
+
+    result = "".join(_convert_lines(markdown_text.splitlines(), converter, _budgeted_renderer(budget)))
+    if budget.degraded_blocks and not fallback:
+        raise ConversionTimeoutError("Conversion time budget exhausted.", result)
+    return result
+
+
+def convert_to_sink_with_limits(
+    markdown: Union[str, Iterable[str]],
+    sink: _TextSink,
+    options: Union[Converter, Dict[str, Any], None] = None,
+    time_budget: Optional[float] = None,
+    budget: Optional[ConversionBudget] = None,
+) -> int:
+    """
+    Converte como markdown_to_sink, com limite de tempo.
+
+    Quando o prazo acaba, o restante do texto é escrito sem estilos inline
+    (como em convert_with_limits com fallback=True); `budget.degraded_blocks`
+    diz se isso aconteceu. Como a saída já foi escrita no destino, não há
+    opção de lançar ConversionTimeoutError.
+
+    Args:
+        markdown: O texto Markdown completo, ou um iterável de linhas.
+        sink: O destino, como em markdown_to_sink.
+        options: As mesmas opções de markdown_to_unicode, ou um Converter pronto.
+        time_budget: Segundos disponíveis para a conversão.
+        budget: Um ConversionBudget já criado; tem precedência sobre `time_budget`.
+
+    Returns:
+        O número de caracteres escritos.
+    """
+    converter = options if isinstance(options, Converter) else Converter(options)
+    if budget is None:
+        budget = ConversionBudget(time_budget)
+    lines = _iter_text_lines(markdown) if isinstance(markdown, str) else _iter_source_lines(markdown)
+    return _write_chunks(_convert_lines(lines, converter, _budgeted_renderer(budget)), sink)
@@ -0,0 +1,113 @@
+"""Conversão reversa: de texto Unicode estilizado de volta para Markdown ou texto simples."""
+
+import re
+from typing import Dict, Match, Optional, Pattern
+
+from .styles import _ALPHANUMERIC_STYLES, _STRIKETHROUGH_CHAR, _style_map
+
+# Estilos produzidos por markdown_to_unicode e os delimitadores que os recriam;
+# a ordem é a da alternância (negrito antes de negrito-itálico, que compartilham
+# os dígitos, para que dígitos soltos voltem como negrito).
+_MARKDOWN_STYLES = (
+    ('bold', 'bold', ('**', '**')),
+    ('bold_italic', 'bold_italic', ('***', '***')),
+    ('italic', 'sans_italic', ('*', '*')),
+    ('monospace', 'monospace', ('`', '`')),
+)
+
+_DELIMITERS = {name: delimiters for name, _, delimiters in _MARKDOWN_STYLES}
+_DELIMITERS['strikethrough'] = ('~~', '~~')
+
+# Entre dois caracteres de um mesmo estilo podem aparecer caracteres que nunca
+# são estilizados (espaços, pontuação, letras acentuadas); eles ficam dentro do
+# span. Quebras de linha, letras/dígitos ASCII, outros caracteres estilizados e
+# delimitadores Markdown encerram o span.
+_INTERIOR = '[^\\nA-Za-z0-9*_`~\\[\\]\\U0001D400-\\U0001D7FF' + _STRIKETHROUGH_CHAR + ']'
+
+# Tabela e expressão são montadas no primeiro uso, como as tabelas de estilo
+_PLAIN_TABLE: Optional[Dict[int, Optional[str]]] = None
+_STYLED_RUN_RE: Optional[Pattern[str]] = None
+
+
+# --- Tabelas Reversas (construídas no primeiro uso) ---
+def _plain_table() -> Dict[int, Optional[str]]:
+    """Tabela única para texto simples: remove todos os estilos registrados e o riscado."""
+    global _PLAIN_TABLE
+    if _PLAIN_TABLE is None:
+        table: Dict[int, Optional[str]] = {}
+        for style in _ALPHANUMERIC_STYLES:
+            for plain, styled in _style_map(style).items():
+                table[ord(styled)] = plain
+        table[ord(_STRIKETHROUGH_CHAR)] = None
+        _PLAIN_TABLE = table
+    return _PLAIN_TABLE
+
+
+def _styled_run(mapping: Dict[str, str]) -> str:
+    styled = '[' + ''.join(re.escape(char) for char in sorted(mapping.values())) + ']'
+    return f'{styled}+(?:{_INTERIOR}+{styled}+)*'
+
+
+def _styled_run_re() -> Pattern[str]:
+    """
+    Uma única expressão que encontra, da esquerda para a direita, cada sequência
+    de mesmo estilo: riscado (caractere + U+0336), negrito, negrito-itálico,
+    itálico ou monospace.
+    """
+    global _STYLED_RUN_RE
+    if _STYLED_RUN_RE is None:
+        alternatives = [f'(?P<strikethrough>(?:[^\\n{_STRIKETHROUGH_CHAR}]{_STRIKETHROUGH_CHAR})+)']
+        alternatives += [f'(?P<{name}>{_styled_run(_style_map(style))})' for name, style, _ in _MARKDOWN_STYLES]
+        _STYLED_RUN_RE = re.compile('|'.join(alternatives))
+    return _STYLED_RUN_RE
+
+
+def _markdown_replacer(match: Match[str]) -> str:
+    """Substitui uma sequência estilizada pelo texto original entre delimitadores."""
+    kind = match.lastgroup
+    opening, closing = _DELIMITERS[kind]  # type: ignore[index]
+    run = match.group()
+    if kind == 'strikethrough':
+        # O texto riscado pode conter outros estilos; eles são agrupados dentro do ~~
+        inner = _styled_run_re().sub(_markdown_replacer, run.replace(_STRIKETHROUGH_CHAR, ''))
+        return f"{opening}{inner}{closing}"
+    return f"{opening}{run.translate(_plain_table())}{closing}"
+
+
+def unicode_to_plain(text: str) -> str:
+    """
+    Remove os estilos Unicode de um texto, devolvendo os caracteres ASCII originais.
+
+    Todos os estilos do registro (negrito, itálico, monospace, script,
+    fraktur, etc.) voltam a letras e dígitos comuns, e o caractere
+    combinante de riscado (U+0336) é removido, tudo em uma única chamada de
+    str.translate.
+
+    Args:
+        text: Texto produzido por markdown_to_unicode (ou com os mesmos estilos).
+
+    Returns:
+        O texto sem estilos.
+    """
+    if not isinstance(text, str):
+        raise TypeError("Input must be a string.")
+    return text.translate(_plain_table())
+
+
+def unicode_to_markdown(text: str) -> str:
+    """
+    Converte texto Unicode estilizado de volta para Markdown.
+
+    Sequências de um mesmo estilo são agrupadas em um único span (`**...**`,
+    `***...***`, `*...*`, `` `...` ``, `~~...~~`) em uma passagem linear; espaços e
+    pontuação entre caracteres do mesmo estilo ficam dentro do span.
+
+    Args:
+        text: Texto produzido por markdown_to_unicode (ou com os mesmos estilos).
+
+    Returns:
+        O texto com marcação Markdown.
+    """
+    if not isinstance(text, str):
+        raise TypeError("Input must be a string.")
+    return _styled_run_re().sub(_markdown_replacer, text)
@@ -0,0 +1,428 @@
+"""
+Serviço HTTP assíncrono de conversão (JSON na entrada e na saída).
+
+Execute com `python -m md2unicode.service --port 8080` e envie:
+
+    POST /convert   {"text": "...", "options": {...}}  ->  {"result": "..."}
+    GET  /health    ->  {"status": "ok", ...contadores}
+
+Documentos grandes são decodificados, convertidos e codificados em um pool de
+processos, para que o event loop nunca bloqueie; requisições pequenas que
+chegam ao mesmo tempo são agrupadas em micro-lotes, enviados ao pool em uma
+única chamada. O número de requisições em andamento e o tamanho do corpo são
+limitados (503 e 413), e cada conversão tem um orçamento de tempo: depois dele,
+o restante do texto sai sem estilos inline.
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from .core import _MAX_HORIZONTAL_RULE_CHARS, _MAX_OPTION_CHARS, Converter
+from .limits import ConversionBudget, convert_with_limits
+
+_OptionsKey = Tuple[Tuple[str, Any], ...]
+
+_REASONS = {
+    200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+    411: 'Length Required', 413: 'Payload Too Large', 431: 'Request Header Fields Too Large',
+    500: 'Internal Server Error', 501: 'Not Implemented', 503: 'Service Unavailable',
+}
+
+
+class ServiceBusyError(RuntimeError):
+    """Há conversões demais em andamento (o HTTP responde 503)."""
+
+
+def _check_options(options: Optional[Dict[str, Any]]) -> None:
+    """
+    Lança ValueError para opções que excedem os limites do Converter: ele as
+    ignoraria em silêncio, mas o cliente do serviço recebe 400.
+    """
+    if not options:
+        return
+    for key in ('list_bullet', 'horizontal_rule_char'):
+        value = options.get(key)
+        if isinstance(value, str) and len(value) > _MAX_OPTION_CHARS:
+            raise ValueError(f"'{key}' must have at most {_MAX_OPTION_CHARS} characters")
+    length = options.get('horizontal_rule_length')
+    if isinstance(length, int) and not isinstance(length, bool):
+        char = options.get('horizontal_rule_char')
+        width = len(char) if isinstance(char, str) and char else 1
+        if length * width > _MAX_HORIZONTAL_RULE_CHARS:
+            raise ValueError(f"horizontal rule must have at most {_MAX_HORIZONTAL_RULE_CHARS} characters")
+
+
+def _parse_request(body: bytes) -> Tuple[str, _OptionsKey]:
+    """Decodifica e valida o corpo de POST /convert; ValueError se for inválido."""
+    try:
+        request = json.loads(body)
+    except ValueError:
+        raise ValueError('invalid JSON body')
+    if not isinstance(request, dict) or not isinstance(request.get('text'), str):
+        raise ValueError("'text' must be a string")
+    options = request.get('options')
+    if options is not None and not isinstance(options, dict):
+        raise ValueError("'options' must be an object")
+    _check_options(options)
+    return request['text'], Converter(options).options_key
+
+
+def _encode_json(payload: Dict[str, Any]) -> bytes:
+    return json.dumps(payload, ensure_ascii=False).encode('utf-8')
+
+
+# --- Funções executadas nos workers (precisam ser picklable) ---
+@lru_cache(maxsize=64)
+def _converter_for(options_key: _OptionsKey) -> Converter:
+    """Um Converter por conjunto de opções, reaproveitado dentro de cada worker."""
+    return Converter(dict(options_key))
+
+
+def _convert_one(text: str, options_key: _OptionsKey, time_budget: Optional[float]) -> Tuple[str, bool]:
+    """Converte dentro do orçamento; retorna (resultado, se parte saiu sem estilos)."""
+    budget = ConversionBudget(time_budget)
+    result = convert_with_limits(text, _converter_for(options_key), budget=budget)
+    return result, bool(budget.degraded_blocks)
+
+
+def _convert_batch(items: List[Tuple[str, _OptionsKey]], time_budget: Optional[float]) -> List[Tuple[str, bool]]:
+    return [_convert_one(text, options_key, time_budget) for text, options_key in items]
+
+
+def _convert_body(body: bytes, time_budget: Optional[float]) -> Tuple[int, bytes, bool]:
+    """
+    Atende um POST /convert grande inteiro no worker: decodificar o JSON,
+    converter e codificar a resposta não passam pelo event loop. Retorna
+    (status, corpo da resposta, se parte saiu sem estilos).
+    """
+    try:
+        text, options_key = _parse_request(body)
+    except ValueError as error:
+        return 400, _encode_json({'error': str(error)}), False
+    result, degraded = _convert_one(text, options_key, time_budget)
+    payload: Dict[str, Any] = {'result': result}
+    if degraded:
+        payload['degraded'] = True
+    return 200, _encode_json(payload), degraded
+
+
+def _warm_up() -> None:
+    """Tarefa vazia que obriga o pool a iniciar um worker."""
+    _converter_for(())
+
+
+def _pool_context() -> Any:
+    """
+    Contexto dos processos do pool. Com 'fork', cada worker criado depois que o
+    servidor começou a aceitar conexões herdaria o socket de escuta e as
+    conexões abertas naquele momento (o cliente não recebe EOF enquanto o
+    worker viver); 'forkserver' e 'spawn' começam de um processo limpo.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+
+
+class _HTTPError(Exception):
+    """Erro que vira uma resposta HTTP com o status indicado."""
+
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class ConversionService:
+    """
+    Serviço de conversão sobre asyncio.
+
+    Args:
+        workers: Processos do pool de conversão (padrão: os.cpu_count()).
+        executor: Executor alternativo (por exemplo, um ThreadPoolExecutor);
+                  se informado, `workers` é ignorado e o executor não é
+                  encerrado pelo serviço.
+        max_body_bytes: Tamanho máximo do corpo de uma requisição (413 acima disso).
+        max_pending: Máximo de conversões em andamento (503 acima disso).
+        offload_threshold: Textos a partir deste tamanho (em caracteres) vão
+                  sozinhos para o pool; os menores entram em micro-lotes. Corpos
+                  HTTP a partir deste tamanho (em bytes) também são decodificados
+                  e codificados no pool.
+        batch_size: Máximo de textos por micro-lote.
+        batch_delay: Tempo (s) que o primeiro item de um lote espera por outros.
+        time_budget: Segundos de cada conversão antes de o restante do texto
+                  sair sem estilos inline (None: sem prazo).
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        max_body_bytes: int = 8 * 1024 * 1024,
+        max_pending: int = 1024,
+        offload_threshold: int = 64 * 1024,
+        batch_size: int = 64,
+        batch_delay: float = 0.002,
+        time_budget: Optional[float] = 10.0,
+    ) -> None:
+        self._owns_executor = executor is None
+        self._workers = workers or os.cpu_count() or 1
+        self._executor: Executor = executor or ProcessPoolExecutor(max_workers=self._workers,
+                                                                   mp_context=_pool_context())
+        self.max_body_bytes = max_body_bytes
+        self.max_pending = max_pending
+        self.offload_threshold = offload_threshold
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.time_budget = time_budget
+        self._queue: "Optional[asyncio.Queue[Tuple[str, _OptionsKey, asyncio.Future]]]" = None
+        self._batcher: Optional[asyncio.Task] = None
+        # Referências aos lotes em andamento: o event loop só guarda referências
+        # fracas às tasks, que poderiam ser coletadas antes de terminar
+        self._batch_tasks: Set[asyncio.Task] = set()
+        self._pending = 0
+        self.counters: Dict[str, int] = {
+            'requests': 0, 'conversions': 0, 'batches': 0, 'batched_items': 0,
+            'offloaded': 0, 'rejected': 0, 'errors': 0, 'degraded': 0,
+        }
+
+    # --- Conversão ---
+    async def convert(self, text: str, options: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Converte um texto pelo pool, em micro-lote ou sozinho conforme o tamanho.
+
+        Lança ValueError para opções grandes demais e ServiceBusyError com mais
+        de `max_pending` conversões em andamento.
+        """
+        if not isinstance(text, str):
+            raise TypeError("Input must be a string.")
+        _check_options(options)
+        return await self._convert_key(text, Converter(options).options_key)
+
+    def _reserve(self) -> None:
+        """Conta uma conversão em andamento, ou lança ServiceBusyError."""
+        if self._pending >= self.max_pending:
+            self.counters['rejected'] += 1
+            raise ServiceBusyError('too many pending conversions')
+        self._pending += 1
+
+    async def _convert_key(self, text: str, options_key: _OptionsKey) -> str:
+        self._reserve()
+        loop = asyncio.get_running_loop()
+        try:
+            if len(text) >= self.offload_threshold:
+                self.counters['offloaded'] += 1
+                result, degraded = await loop.run_in_executor(
+                    self._executor, _convert_one, text, options_key, self.time_budget)
+            else:
+                if self._queue is None:
+                    self._queue = asyncio.Queue()
+                    self._batcher = asyncio.create_task(self._run_batcher())
+                future: asyncio.Future = loop.create_future()
+                self._queue.put_nowait((text, options_key, future))
+                result, degraded = await future
+        finally:
+            self._pending -= 1
+        self.counters['conversions'] += 1
+        self.counters['degraded'] += degraded
+        return result
+
+    async def _convert_large_body(self, body: bytes) -> Tuple[int, bytes]:
+        """Atende um corpo grande inteiro no pool (veja _convert_body)."""
+        self._reserve()
+        try:
+            self.counters['offloaded'] += 1
+            status, response, degraded = await asyncio.get_running_loop().run_in_executor(
+                self._executor, _convert_body, body, self.time_budget)
+        finally:
+            self._pending -= 1
+        if status == 200:
+            self.counters['conversions'] += 1
+            self.counters['degraded'] += degraded
+        return status, response
+
+    async def _run_batcher(self) -> None:
+        """Agrupa requisições pequenas concorrentes e as envia ao pool em lotes."""
+        assert self._queue is not None
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            if queue.empty() and self.batch_delay > 0:
+                await asyncio.sleep(self.batch_delay)
+            while len(batch) < self.batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            # O lote roda em segundo plano; o batcher já volta a coletar o próximo
+            task = asyncio.create_task(self._dispatch_batch(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _dispatch_batch(self, batch: List[Tuple[str, _OptionsKey, asyncio.Future]]) -> None:
+        self.counters['batches'] += 1
+        self.counters['batched_items'] += len(batch)
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(
+                self._executor, _convert_batch, [(text, options_key) for text, options_key, _ in batch],
+                self.time_budget)
+        except Exception as error:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        for (_, _, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    # --- HTTP ---
+    async def start(self, host: str = '127.0.0.1', port: int = 8080) -> asyncio.AbstractServer:
+        """Começa a aceitar conexões; retorna o servidor asyncio."""
+        if self._owns_executor:
+            # Inicia os workers antes de aceitar conexões, para que a primeira
+            # requisição não espere pela criação dos processos
+            loop = asyncio.get_running_loop()
+            await asyncio.gather(*(loop.run_in_executor(self._executor, _warm_up) for _ in range(self._workers)))
+        return await asyncio.start_server(self._handle_connection, host, port, limit=64 * 1024)
+
+    async def close(self) -> None:
+        """Encerra o batcher e o pool (se foi criado pelo serviço)."""
+        if self._batcher is not None:
+            self._batcher.cancel()
+        if self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            keep_alive = True
+            while keep_alive:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except asyncio.IncompleteReadError:
+                    return
+                except asyncio.LimitOverrunError:
+                    await self._respond(writer, 431, {'error': 'headers too large'}, keep_alive=False)
+                    return
+                status, payload, keep_alive = await self._handle_request(head, reader)
+                await self._respond(writer, status, payload, keep_alive)
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+    async def _handle_request(self, head: bytes, reader: asyncio.StreamReader) -> Tuple[int, Any, bool]:
+        """Processa uma requisição; retorna (status, corpo JSON ou já codificado, manter conexão)."""
+        self.counters['requests'] += 1
+        lines = head.decode('latin-1').split('\r\n')
+        try:
+            method, target, version = lines[0].split(' ', 2)
+        except ValueError:
+            return 400, {'error': 'malformed request line'}, False
+        headers = {}
+        for line in lines[1:]:
+            if ':' in line:
+                name, value = line.split(':', 1)
+                headers[name.strip().lower()] = value.strip()
+        connection = headers.get('connection', '').lower()
+        keep_alive = connection != 'close' and (version == 'HTTP/1.1' or connection == 'keep-alive')
+        path = target.split('?', 1)[0]
+
+        try:
+            body = await self._read_body(headers, reader)
+            if path == '/health':
+                if method != 'GET':
+                    raise _HTTPError(405, 'use GET')
+                return 200, {'status': 'ok', 'pending': self._pending, **self.counters}, keep_alive
+            if path != '/convert':
+                raise _HTTPError(404, 'not found')
+            if method != 'POST':
+                raise _HTTPError(405, 'use POST')
+            if len(body) >= self.offload_threshold:
+                status, response = await self._convert_large_body(body)
+                return status, response, keep_alive
+            text, options_key = _parse_request(body)
+            return 200, {'result': await self._convert_key(text, options_key)}, keep_alive
+        except _HTTPError as error:
+            # Um corpo grande demais não foi lido; a conexão não pode ser reaproveitada
+            return error.status, {'error': error.message}, keep_alive and error.status not in (411, 413, 501)
+        except ValueError as error:
+            return 400, {'error': str(error)}, keep_alive
+        except ServiceBusyError as error:
+            return 503, {'error': str(error)}, keep_alive
+        except Exception as error:
+            self.counters['errors'] += 1
+            return 500, {'error': str(error)}, keep_alive
+
+    async def _read_body(self, headers: Dict[str, str], reader: asyncio.StreamReader) -> bytes:
+        if 'transfer-encoding' in headers:
+            raise _HTTPError(501, 'chunked bodies are not supported')
+        length_header = headers.get('content-length')
+        if length_header is None:
+            return b''
+        try:
+            length = int(length_header)
+        except ValueError:
+            raise _HTTPError(411, 'invalid Content-Length')
+        if length < 0:
+            raise _HTTPError(411, 'invalid Content-Length')
+        if length > self.max_body_bytes:
+            raise _HTTPError(413, f'body larger than {self.max_body_bytes} bytes')
+        return await reader.readexactly(length)
+
+    async def _respond(self, writer: asyncio.StreamWriter, status: int, payload: Any,
+                       keep_alive: bool) -> None:
+        # Respostas grandes chegam do pool já codificadas
+        body = payload if isinstance(payload, bytes) else _encode_json(payload)
+        head = (f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+                f"Content-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n")
+        if status == 503:
+            head += "Retry-After: 1\r\n"
+        writer.write(head.encode('latin-1') + b"\r\n" + body)
+        await writer.drain()
+
+
+async def serve(host: str, port: int, **settings: Any) -> None:
+    """Executa o serviço até ser interrompido."""
+    service = ConversionService(**settings)
+    server = await service.start(host, port)
+    addresses = ', '.join(str(sock.getsockname()) for sock in server.sockets)
+    print(f"md2unicode.service ouvindo em {addresses}", file=sys.stderr)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.close()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m md2unicode.service',
+                                     description='Serviço HTTP de conversão Markdown -> Unicode.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--workers', type=int, default=None, help='processos de conversão (padrão: núcleos)')
+    parser.add_argument('--max-body-bytes', type=int, default=8 * 1024 * 1024)
+    parser.add_argument('--max-pending', type=int, default=1024)
+    parser.add_argument('--offload-threshold', type=int, default=64 * 1024,
+                        help='textos a partir deste tamanho não entram em micro-lotes')
+    parser.add_argument('--batch-size', type=int, default=64)
+    parser.add_argument('--batch-delay', type=float, default=0.002, help='espera (s) para formar um lote')
+    parser.add_argument('--time-budget', type=float, default=10.0,
+                        help='segundos de cada conversão antes de o restante sair sem estilos inline')
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, workers=args.workers, max_body_bytes=args.max_body_bytes,
+                          max_pending=args.max_pending, offload_threshold=args.offload_threshold,
+                          batch_size=args.batch_size, batch_delay=args.batch_delay,
+                          time_budget=args.time_budget))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""Instrumentação opcional da conversão: tempo por etapa e contadores."""
+
+from typing import Any, Dict
+
+
+class ConversionStats:
+    """
+    Tempos e contadores de uma ou mais conversões.
+
+    Passe uma instância em `stats=` para markdown_to_unicode (ou para os métodos
+    de Converter) e ela será preenchida durante a conversão. Os valores se
+    acumulam entre chamadas, então a mesma instância pode agregar um lote
+    inteiro. Sem `stats`, a conversão segue pelo caminho sem instrumentação.
+
+    Etapas medidas (em segundos):
+        block_seconds: classificação e transformação das linhas de bloco.
+        inline_scan_seconds: varredura inline (pilha de delimitadores).
+        inline_render_seconds: aplicação dos estilos aos spans reconhecidos.
+        join_seconds: montagem da string final.
+
+    `input_characters` conta o conteúdo das linhas, sem as quebras de linha.
+    """
+
+    def __init__(self) -> None:
+        self.conversions = 0
+        self.input_characters = 0
+        self.output_characters = 0
+        self.lines = 0
+        self.paragraphs = 0
+        self.block_seconds = 0.0
+        self.inline_scan_seconds = 0.0
+        self.inline_render_seconds = 0.0
+        self.join_seconds = 0.0
+        self.restyled_characters = 0
+        self.block_counts: Dict[str, int] = {}
+        self.construct_counts: Dict[str, int] = {}
+
+    @property
+    def total_seconds(self) -> float:
+        """Soma dos tempos de todas as etapas."""
+        return self.block_seconds + self.inline_scan_seconds + self.inline_render_seconds + self.join_seconds
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Representação plana, pronta para exportar a um painel de métricas."""
+        data: Dict[str, Any] = {
+            'conversions': self.conversions,
+            'input_characters': self.input_characters,
+            'output_characters': self.output_characters,
+            'lines': self.lines,
+            'paragraphs': self.paragraphs,
+            'block_seconds': self.block_seconds,
+            'inline_scan_seconds': self.inline_scan_seconds,
+            'inline_render_seconds': self.inline_render_seconds,
+            'join_seconds': self.join_seconds,
+            'total_seconds': self.total_seconds,
+            'restyled_characters': self.restyled_characters,
+        }
+        for kind, count in self.block_counts.items():
+            data[f'block_{kind}'] = count
+        for construct, count in self.construct_counts.items():
+            data[f'inline_{construct}'] = count
+        return data
+
+    def __repr__(self) -> str:
+        return (f"ConversionStats(conversions={self.conversions}, lines={self.lines}, "
+                f"total_seconds={self.total_seconds:.6f})")
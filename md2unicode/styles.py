@@ -0,0 +1,138 @@
+"""Registro de estilos Unicode e funções auxiliares para aplicá-los."""
+
+from typing import Dict, Optional, Tuple
+
+# --- Registro de Estilos (bloco Mathematical Alphanumeric Symbols) ---
+# Cada estilo é descrito pelo codepoint de 'A', de 'a' e de '0' (None quando o
+# estilo não tem dígitos próprios). As letras seguem em ordem a partir desses
+# pontos, então as tabelas são geradas em vez de escritas à mão.
+_ALPHANUMERIC_STYLES: Dict[str, Tuple[int, int, Optional[int]]] = {
+    'bold': (0x1D400, 0x1D41A, 0x1D7CE),
+    'italic': (0x1D434, 0x1D44E, None),
+    'bold_italic': (0x1D468, 0x1D482, 0x1D7CE), # dígitos do negrito
+    'script': (0x1D49C, 0x1D4B6, None),
+    'bold_script': (0x1D4D0, 0x1D4EA, 0x1D7CE), # dígitos do negrito
+    'fraktur': (0x1D504, 0x1D51E, None),
+    'double_struck': (0x1D538, 0x1D552, 0x1D7D8),
+    'bold_fraktur': (0x1D56C, 0x1D586, 0x1D7CE), # dígitos do negrito
+    'sans': (0x1D5A0, 0x1D5BA, 0x1D7E2),
+    'sans_bold': (0x1D5D4, 0x1D5EE, 0x1D7EC),
+    'sans_italic': (0x1D608, 0x1D622, 0x1D7E2), # dígitos sans-serif
+    'sans_bold_italic': (0x1D63C, 0x1D656, 0x1D7EC), # dígitos sans-serif negrito
+    'monospace': (0x1D670, 0x1D68A, 0x1D7F6),
+}
+
+# Posições reservadas do bloco: esses caracteres já existiam no bloco
+# Letterlike Symbols e a posição "esperada" fica sem caractere atribuído.
+_RESERVED_EXCEPTIONS: Dict[str, Dict[str, int]] = {
+    'italic': {'h': 0x210E},
+    'script': {
+        'B': 0x212C, 'E': 0x2130, 'F': 0x2131, 'H': 0x210B, 'I': 0x2110, 'L': 0x2112,
+        'M': 0x2133, 'R': 0x211B, 'e': 0x212F, 'g': 0x210A, 'o': 0x2134,
+    },
+    'fraktur': {'C': 0x212D, 'H': 0x210C, 'I': 0x2111, 'R': 0x211C, 'Z': 0x2128},
+    'double_struck': {'C': 0x2102, 'H': 0x210D, 'N': 0x2115, 'P': 0x2119, 'Q': 0x211A, 'R': 0x211D, 'Z': 0x2124},
+}
+
+_STRIKETHROUGH_CHAR = '\u0336' # Combining Long Stroke Overlay
+
+# Estilos do registro usados pela conversão Markdown
+_BOLD_STYLE = 'bold'
+_ITALIC_STYLE = 'sans_italic'
+_BOLD_ITALIC_STYLE = 'bold_italic'
+_MONOSPACE_STYLE = 'monospace'
+
+# Trechos a partir deste tamanho usam o backend vetorizado (NumPy), se houver
+_VECTORIZE_MIN_CHARS = 32 * 1024
+
+# Tabelas de tradução já construídas; cada uma só é gerada no primeiro uso do
+# estilo, então a importação não depende da quantidade de estilos registrados.
+_TABLES: Dict[str, Dict[int, str]] = {}
+
+
+def _style_map(style: str) -> Dict[str, str]:
+    """Gera o mapeamento caractere ASCII -> caractere estilizado de um estilo."""
+    upper, lower, digits = _ALPHANUMERIC_STYLES[style]
+    mapping = {chr(ord('A') + offset): chr(upper + offset) for offset in range(26)}
+    mapping.update((chr(ord('a') + offset), chr(lower + offset)) for offset in range(26))
+    if digits is not None:
+        mapping.update((chr(ord('0') + offset), chr(digits + offset)) for offset in range(10))
+    for plain, codepoint in _RESERVED_EXCEPTIONS.get(style, {}).items():
+        mapping[plain] = chr(codepoint)
+    return mapping
+
+
+def _style_table(style: str) -> Dict[int, str]:
+    """Retorna a tabela de tradução de um estilo, construindo-a no primeiro uso."""
+    table = _TABLES.get(style)
+    if table is None:
+        table = _TABLES[style] = str.maketrans(_style_map(style))
+    return table
+
+
+# --- Funções Auxiliares para Aplicar Estilos ---
+def _apply_vectorized(text: str, styles: Tuple[str, ...], strike: bool) -> Optional[str]:
+    """Estiliza um trecho grande com o backend NumPy; None se ele não estiver disponível."""
+    from .vectorized import apply_styles
+    return apply_styles(text, styles, strike)
+
+
+def _apply_style(text: str, style: str) -> str:
+    """Aplica a tabela de tradução (codepoint -> caractere) de um estilo a uma string."""
+    if len(text) >= _VECTORIZE_MIN_CHARS:
+        result = _apply_vectorized(text, (style,), False)
+        if result is not None:
+            return result
+    # str.translate aplica o mapeamento em C, sem um loop Python por caractere
+    table = _TABLES.get(style)
+    if table is None:
+        table = _style_table(style)
+    return text.translate(table)
+
+def _to_bold(text: str) -> str:
+    """Converte texto para Unicode Bold."""
+    return _apply_style(text, _BOLD_STYLE)
+
+def _to_italic(text: str) -> str:
+    """Converte texto para Unicode Italic (sans-serif, com dígitos sans-serif)."""
+    return _apply_style(text, _ITALIC_STYLE)
+
+def _to_bold_italic(text: str) -> str:
+    """Converte texto para Unicode Bold Italic."""
+    return _apply_style(text, _BOLD_ITALIC_STYLE)
+
+def _to_monospace(text: str) -> str:
+    """Converte texto para Unicode Monospace."""
+    return _apply_style(text, _MONOSPACE_STYLE)
+
+def _to_strikethrough(text: str) -> str:
+    """Aplica o caractere de Strikethrough a cada caractere."""
+    # Equivale a acrescentar o caractere após cada caractere, mas em um único join
+    if not text:
+        return text
+    if len(text) >= _VECTORIZE_MIN_CHARS:
+        result = _apply_vectorized(text, (), True)
+        if result is not None:
+            return result
+    return _STRIKETHROUGH_CHAR.join(text) + _STRIKETHROUGH_CHAR
+
+
+def stylize(text: str, style: str) -> str:
+    """
+    Converte as letras e dígitos ASCII de um texto para um estilo Unicode.
+
+    Args:
+        text: O texto a converter; outros caracteres são mantidos.
+        style: Um dos estilos registrados: 'bold', 'italic', 'bold_italic',
+               'script', 'bold_script', 'fraktur', 'bold_fraktur',
+               'double_struck', 'sans', 'sans_bold', 'sans_italic',
+               'sans_bold_italic' ou 'monospace'.
+
+    Returns:
+        O texto estilizado. Estilos sem dígitos próprios mantêm os dígitos.
+    """
+    if not isinstance(text, str):
+        raise TypeError("Input must be a string.")
+    if style not in _ALPHANUMERIC_STYLES:
+        raise ValueError(f"Unknown style {style!r}; expected one of {', '.join(_ALPHANUMERIC_STYLES)}.")
+    return _apply_style(text, style)
@@ -0,0 +1,85 @@
+"""
+Backend vetorizado opcional (NumPy) para estilizar trechos muito grandes.
+
+O texto é codificado uma vez em um array UTF-32, os estilos são aplicados com
+uma única consulta a uma tabela de 128 posições (as tabelas de uma chave de
+estilo são combinadas antes), o riscado é intercalado com U+0336 por fatias e
+o resultado é decodificado uma vez no final. O NumPy só é importado quando o
+primeiro trecho grande aparece; sem ele, os chamadores seguem com
+str.translate, com o mesmo resultado.
+"""
+
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from .styles import _STRIKETHROUGH_CHAR, _style_map
+
+# None: ainda não testado; False: indisponível ou desativado
+_NUMPY: Any = None
+_ENABLED = True
+
+# Tabelas de consulta por sequência de estilos (do mais interno ao mais externo)
+_LOOKUPS: Dict[Tuple[str, ...], Any] = {}
+
+
+def _load_numpy() -> Any:
+    global _NUMPY
+    if _NUMPY is None:
+        try:
+            import numpy
+        except ImportError:
+            _NUMPY = False
+        else:
+            _NUMPY = numpy
+    return _NUMPY
+
+
+def available() -> bool:
+    """True se o backend está ativado e o NumPy pode ser importado."""
+    return _ENABLED and _load_numpy() is not False
+
+
+def set_enabled(enabled: bool) -> None:
+    """Ativa ou desativa o backend (por exemplo, para comparar os dois caminhos)."""
+    global _ENABLED
+    _ENABLED = enabled
+
+
+def _lookup(styles: Tuple[str, ...]) -> Any:
+    """Tabela ASCII -> codepoint equivalente a aplicar os estilos em sequência."""
+    table = _LOOKUPS.get(styles)
+    if table is None:
+        numpy = _NUMPY
+        table = numpy.arange(128, dtype=numpy.uint32)
+        for style in styles:
+            for plain, styled in _style_map(style).items():
+                # Só caracteres ainda ASCII são alterados pelos estilos seguintes
+                if table[ord(plain)] == ord(plain):
+                    table[ord(plain)] = ord(styled)
+        _LOOKUPS[styles] = table
+    return table
+
+
+def apply_styles(text: str, styles: Sequence[str], strike: bool = False) -> Optional[str]:
+    """
+    Aplica estilos do registro (na ordem dada) e, opcionalmente, o riscado.
+
+    Returns:
+        O texto estilizado, ou None se o backend não estiver disponível (o
+        chamador deve então usar o caminho com str.translate).
+    """
+    if not _ENABLED:
+        return None
+    numpy = _load_numpy()
+    if numpy is False:
+        return None
+
+    codes = numpy.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype='<u4')
+    if styles:
+        table = _lookup(tuple(styles))
+        codes = numpy.where(codes < 128, table[codes & 127], codes)
+    if strike:
+        interleaved = numpy.empty(2 * len(codes), dtype='<u4')
+        interleaved[0::2] = codes
+        interleaved[1::2] = ord(_STRIKETHROUGH_CHAR)
+        codes = interleaved
+    return codes.tobytes().decode('utf-32-le', 'surrogatepass')
@@ -0,0 +1,37 @@
+"""Textos de entrada compartilhados pelos testes que comparam caminhos de conversão."""
+
+import random
+
+SAMPLES = [
+    "",
+    "\n",
+    "texto simples",
+    "# Título\n\nUm **negrito**, um *itálico*, um ***ambos*** e ~~riscado~~.",
+    "## Subtítulo com `código` e [link](https://example.com)\n",
+    "> citação\n> > aninhada\n\n- item\n  - subitem\n* outro\n1. numerado\n",
+    "---\n***\n___\n",
+    "```python\n**não converte**\n\n# nem isto\n```\n\ndepois **sim**",
+    "~~~\naberto sem fechar\n\n**dentro**",
+    "linha\r\noutra\rterceira\x0bquarta quinta",
+    "**não fecha\n\n*nem este\n\n_sublinhado_ e __duplo__",
+    "\n\n\nparágrafo\n\n\n\noutro\n\n",
+    "*_*_*_*_ **_*x*_** `*` \\*escapado\\*",
+]
+
+OPTION_SETS = [
+    None,
+    {'header_style': 'bold'},
+    {'list_bullet': '-', 'horizontal_rule_char': '=', 'horizontal_rule_length': 5},
+]
+
+ATOMS = ['*', '**', '_', '~~', '`', '```', '~~~', '[l](u)', '\n', '\n\n', '\n\n\n',
+         '# ', '> ', '- ', '* ', '  - ', '1. ', '---', '***', 'a', 'b c', ' ', '\t']
+
+
+def random_documents(count, seed=4):
+    """Documentos curtos e determinísticos, montados com os elementos de ATOMS."""
+    rng = random.Random(seed)
+    return [''.join(rng.choice(ATOMS) for _ in range(rng.randint(0, 60))) for _ in range(count)]
+
+
+DOCUMENTS = SAMPLES + random_documents(400)
@@ -0,0 +1,23 @@
+"""A divisão em trechos da conversão paralela deve preservar o resultado."""
+
+import unittest
+
+from _corpus import DOCUMENTS
+
+from md2unicode import markdown_to_unicode
+from md2unicode.batch import _split_blocks
+
+
+class TestSplitBlocks(unittest.TestCase):
+    def test_parts_convert_like_whole_text(self):
+        text = "\n\n".join(DOCUMENTS)
+        expected = markdown_to_unicode(text)
+        for parts in (1, 2, 3, 8, 50):
+            with self.subTest(parts=parts):
+                chunks = _split_blocks(text, parts)
+                self.assertEqual("".join(chunks), text)
+                self.assertEqual("\n".join(markdown_to_unicode(chunk) for chunk in chunks), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
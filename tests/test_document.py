@@ -0,0 +1,27 @@
+"""render_unicode(parse_markdown(texto)) deve produzir o mesmo que markdown_to_unicode."""
+
+import unittest
+
+from _corpus import DOCUMENTS, OPTION_SETS, SAMPLES
+
+from md2unicode import markdown_to_unicode, parse_markdown, render_unicode
+
+
+class TestDocumentRender(unittest.TestCase):
+    def test_render_unicode_matches(self):
+        for options in OPTION_SETS:
+            for text in DOCUMENTS:
+                with self.subTest(text=text, options=options):
+                    self.assertEqual(render_unicode(parse_markdown(text), options),
+                                     markdown_to_unicode(text, options))
+
+    def test_one_document_many_option_sets(self):
+        text = "\n\n".join(SAMPLES)
+        document = parse_markdown(text)
+        for options in OPTION_SETS:
+            with self.subTest(options=options):
+                self.assertEqual(render_unicode(document, options), markdown_to_unicode(text, options))
+
+
+if __name__ == '__main__':
+    unittest.main()
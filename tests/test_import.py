@@ -0,0 +1,45 @@
+"""Importar md2unicode não pode carregar dependências pesadas nem opcionais."""
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Módulos que só podem ser importados sob demanda (Streamlit e pyperclip são do
+# app; concurrent.futures e NumPy só quando a conversão paralela ou vetorizada
+# é usada)
+FORBIDDEN_MODULES = ('streamlit', 'pyperclip', 'concurrent.futures', 'numpy')
+
+# Tempo máximo da importação, medido dentro de um interpretador novo
+IMPORT_TIME_BUDGET_SECONDS = 0.5
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import md2unicode
+elapsed = time.perf_counter() - start
+print(json.dumps({'elapsed': elapsed, 'modules': sorted(sys.modules)}))
+"""
+
+
+class TestImport(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        env = dict(os.environ, PYTHONPATH=ROOT)
+        completed = subprocess.run([sys.executable, '-c', _PROBE], cwd=ROOT, env=env,
+                                   capture_output=True, text=True, check=True)
+        cls.result = json.loads(completed.stdout)
+
+    def test_no_heavy_modules(self):
+        loaded = [name for name in FORBIDDEN_MODULES if name in self.result['modules']]
+        self.assertEqual(loaded, [])
+
+    def test_import_time(self):
+        self.assertLess(self.result['elapsed'], IMPORT_TIME_BUDGET_SECONDS)
+
+
+if __name__ == '__main__':
+    unittest.main()
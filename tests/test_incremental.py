@@ -0,0 +1,25 @@
+"""IncrementalConverter deve produzir o mesmo que markdown_to_unicode a cada edição."""
+
+import random
+import unittest
+
+from _corpus import ATOMS, DOCUMENTS, OPTION_SETS
+
+from md2unicode import IncrementalConverter, markdown_to_unicode
+
+
+class TestIncrementalConverter(unittest.TestCase):
+    def test_edits_and_option_changes(self):
+        rng = random.Random(7)
+        converter = IncrementalConverter()
+        for text in DOCUMENTS:
+            for _ in range(3):
+                options = rng.choice(OPTION_SETS) or {}
+                with self.subTest(text=text, options=options):
+                    self.assertEqual(converter.convert(text, options), markdown_to_unicode(text, options))
+                cut = rng.randint(0, len(text))
+                text = text[:cut] + rng.choice(ATOMS) + text[rng.randint(cut, len(text)):]
+
+
+if __name__ == '__main__':
+    unittest.main()
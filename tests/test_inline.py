@@ -0,0 +1,42 @@
+"""Saída esperada dos elementos inline (passagem única com pilha de delimitadores)."""
+
+import unittest
+
+from md2unicode import markdown_to_unicode
+
+
+class TestInlineOutput(unittest.TestCase):
+    def test_emphasis(self):
+        cases = {
+            '*a*': '\U0001D622',
+            '_a_': '\U0001D622',
+            '**a**': '\U0001D41A',
+            '__a__': '\U0001D41A',
+            '***a***': '\U0001D482',
+            '~~a~~': 'a̶',
+            '`a`': '\U0001D68A',
+        }
+        for markdown, expected in cases.items():
+            with self.subTest(markdown=markdown):
+                self.assertEqual(markdown_to_unicode(markdown), expected)
+
+    def test_nested_emphasis(self):
+        # Itálico dentro de negrito (ou o contrário) vira negrito-itálico
+        self.assertEqual(markdown_to_unicode('**a _b_**'), '\U0001D41A \U0001D483')
+        self.assertEqual(markdown_to_unicode('*a **b** c*'), '\U0001D622 \U0001D483 \U0001D624')
+
+    def test_links_keep_styled_text(self):
+        self.assertEqual(markdown_to_unicode('[t *x*](u)'), 't \U0001D639')
+
+    def test_unmatched_delimiters_stay_literal(self):
+        for markdown in ('\\*a\\*', '**a', '~a~', '**a*'):
+            with self.subTest(markdown=markdown):
+                self.assertEqual(markdown_to_unicode(markdown), markdown)
+
+    def test_spent_tilde_opener(self):
+        # Um '~~~' casado com '~~' sobra com um '~' literal, que não abre mais nada
+        self.assertEqual(markdown_to_unicode('x ~~~a ~~b~~ *c*'), 'x ~a̶ ̶b~~ \U0001D624')
+
+
+if __name__ == '__main__':
+    unittest.main()
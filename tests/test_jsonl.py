@@ -0,0 +1,85 @@
+"""convert_jsonl retomado após uma falha deve gerar a mesma saída, byte a byte."""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from _corpus import DOCUMENTS
+
+from md2unicode import jsonl
+from md2unicode.jsonl import convert_jsonl
+
+
+class _Crash(Exception):
+    pass
+
+
+def _crash_after(calls):
+    """Um _convert_chunk que falha na chamada de número `calls + 1`."""
+    convert_chunk = jsonl._convert_chunk
+
+    def crashing(texts):
+        nonlocal calls
+        if calls == 0:
+            raise _Crash()
+        calls -= 1
+        return convert_chunk(texts)
+
+    return crashing
+
+
+class TestResume(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.input = os.path.join(self.directory, 'entrada.jsonl')
+        lines = []
+        for number, text in enumerate(DOCUMENTS * 2):
+            if number % 50 == 7:
+                lines.append('')
+            elif number % 50 == 9:
+                lines.append(json.dumps({'other': text}))
+            else:
+                lines.append(json.dumps({'id': number, 'body': text}, ensure_ascii=number % 2 == 0))
+        with open(self.input, 'w', encoding='utf-8') as handle:
+            handle.write('\n'.join(lines))  # sem quebra de linha no final
+        self.expected = self.convert('esperado.jsonl')
+
+    def convert(self, name, **kwargs):
+        output = os.path.join(self.directory, name)
+        convert_jsonl(self.input, output, workers=1, chunksize=16, checkpoint_every=32, **kwargs)
+        with open(output, 'rb') as handle:
+            return handle.read()
+
+    def test_resume_after_crash(self):
+        output = os.path.join(self.directory, 'saida.jsonl')
+        with mock.patch.object(jsonl, '_convert_chunk', _crash_after(10)):
+            with self.assertRaises(_Crash):
+                convert_jsonl(self.input, output, workers=1, chunksize=16, checkpoint_every=32)
+        self.assertTrue(os.path.exists(output + '.checkpoint'))
+
+        report = convert_jsonl(self.input, output, workers=1, chunksize=16, checkpoint_every=32)
+        self.assertEqual(report.resumed_lines, 10 * 16)
+        with open(output, 'rb') as handle:
+            self.assertEqual(handle.read(), self.expected)
+        self.assertFalse(os.path.exists(output + '.checkpoint'))
+
+    def test_resume_discards_output_after_checkpoint(self):
+        # Um processo morto depois do checkpoint pode ter escrito mais linhas
+        output = os.path.join(self.directory, 'saida.jsonl')
+        with mock.patch.object(jsonl, '_convert_chunk', _crash_after(5)):
+            with self.assertRaises(_Crash):
+                convert_jsonl(self.input, output, workers=1, chunksize=16, checkpoint_every=32)
+        with open(output, 'ab') as handle:
+            handle.write(b'{"id": "parcial", "bo')
+
+        convert_jsonl(self.input, output, workers=1, chunksize=16, checkpoint_every=32)
+        with open(output, 'rb') as handle:
+            self.assertEqual(handle.read(), self.expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+"""Orçamento de tempo dentro de parágrafos grandes e limites das opções."""
+
+import unittest
+
+from md2unicode import ConversionBudget, IncrementalConverter, convert_with_limits, markdown_to_unicode
+
+
+class _ExpiresAfter(ConversionBudget):
+    """Prazo que acaba depois de `calls` consultas, sem depender do relógio."""
+
+    def __init__(self, calls):
+        super().__init__()
+        self.calls = calls
+
+    def expired(self):
+        self.calls -= 1
+        return self.calls < 0
+
+
+class TestBudgetInsideParagraph(unittest.TestCase):
+    # Um único parágrafo: só a consulta feita durante a varredura pode degradá-lo
+    TEXT = '*a* _b_ ' * 10000
+
+    def test_convert_with_limits(self):
+        budget = _ExpiresAfter(1)
+        self.assertEqual(convert_with_limits(self.TEXT, budget=budget), self.TEXT)
+        self.assertEqual(budget.degraded_blocks, 1)
+
+    def test_incremental_converter(self):
+        budget = _ExpiresAfter(1)
+        self.assertEqual(IncrementalConverter().convert(self.TEXT, budget=budget), self.TEXT)
+        self.assertEqual(budget.degraded_blocks, 1)
+
+    def test_unexpired_budget_keeps_output(self):
+        budget = ConversionBudget(None)
+        self.assertEqual(convert_with_limits(self.TEXT, budget=budget), markdown_to_unicode(self.TEXT))
+        self.assertEqual(budget.degraded_blocks, 0)
+
+
+class TestOptionLimits(unittest.TestCase):
+    def test_oversized_options_are_ignored(self):
+        default = markdown_to_unicode('- a\n\n---')
+        for options in ({'list_bullet': 'x' * 65}, {'horizontal_rule_char': '=' * 65},
+                        {'horizontal_rule_length': 1025},
+                        {'horizontal_rule_char': '=' * 4, 'horizontal_rule_length': 257}):
+            with self.subTest(options=options):
+                self.assertEqual(markdown_to_unicode('- a\n\n---', options), default)
+
+    def test_options_at_the_limit(self):
+        self.assertEqual(markdown_to_unicode('---', {'horizontal_rule_char': '=' * 4, 'horizontal_rule_length': 256}),
+                         '=' * 1024)
+        self.assertEqual(markdown_to_unicode('- a', {'list_bullet': 'x' * 64}), 'x' * 64 + ' a')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+"""unicode_to_markdown e unicode_to_plain desfazem a conversão."""
+
+import unittest
+
+from md2unicode import markdown_to_unicode, stylize, unicode_to_markdown, unicode_to_plain
+
+# Markdown que volta idêntico depois de markdown_to_unicode e unicode_to_markdown
+ROUND_TRIPS = [
+    'Olá, **mundo**!',
+    '**negrito** e *itálico* e ***ambos*** e `code` e ~~risco~~',
+    '**123** *x1*',
+    'linha *um*\nlinha **dois**',
+]
+
+
+class TestReverse(unittest.TestCase):
+    def test_literal_examples(self):
+        self.assertEqual(unicode_to_markdown('Olá, \U0001D426\U0001D42E\U0001D427\U0001D41D\U0001D428!'),
+                         'Olá, **mundo**!')
+        self.assertEqual(unicode_to_plain('Olá, \U0001D426\U0001D42E\U0001D427\U0001D41D\U0001D428!'),
+                         'Olá, mundo!')
+        self.assertEqual(unicode_to_plain('r̶i̶s̶c̶o̶'), 'risco')
+
+    def test_markdown_round_trip(self):
+        for markdown in ROUND_TRIPS:
+            with self.subTest(markdown=markdown):
+                self.assertEqual(unicode_to_markdown(markdown_to_unicode(markdown)), markdown)
+
+    def test_plain_removes_every_style(self):
+        self.assertEqual(unicode_to_plain(markdown_to_unicode('**a** *b* ***c*** `d` ~~e~~')), 'a b c d e')
+        for style in ('bold', 'italic', 'script', 'bold_script', 'fraktur', 'bold_fraktur',
+                      'double_struck', 'sans', 'sans_bold', 'sans_italic', 'sans_bold_italic', 'monospace'):
+            with self.subTest(style=style):
+                self.assertEqual(unicode_to_plain(stylize('Hello World 0189', style)), 'Hello World 0189')
+
+    def test_unstyled_text_is_unchanged(self):
+        text = 'texto comum, com acentos (ç, ã) e *asteriscos*'
+        self.assertEqual(unicode_to_markdown(text), text)
+        self.assertEqual(unicode_to_plain(text), text)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,27 @@
+"""markdown_to_sink deve escrever no destino o mesmo que markdown_to_unicode retorna."""
+
+import io
+import unittest
+
+from _corpus import DOCUMENTS, OPTION_SETS
+
+from md2unicode import markdown_to_sink, markdown_to_unicode
+
+
+class TestMarkdownToSink(unittest.TestCase):
+    def test_string_and_line_sources(self):
+        for options in OPTION_SETS:
+            for text in DOCUMENTS:
+                expected = markdown_to_unicode(text, options)
+                with self.subTest(text=text, options=options):
+                    pieces = []
+                    self.assertEqual(markdown_to_sink(text, pieces, options), len(expected))
+                    self.assertEqual("".join(pieces), expected)
+
+                    output = io.StringIO()
+                    markdown_to_sink(io.StringIO(text, newline=''), output, options)
+                    self.assertEqual(output.getvalue(), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+"""Saída esperada dos estilos Unicode, com os pontos de código reservados."""
+
+import unittest
+
+from md2unicode import stylize
+
+
+class TestStylize(unittest.TestCase):
+    def test_last_letters_and_digits(self):
+        cases = {
+            ('Z', 'monospace'): '\U0001D689',
+            ('z', 'monospace'): '\U0001D6A3',
+            ('9', 'monospace'): '\U0001D7FF',
+            ('Z', 'bold'): '\U0001D419',
+            ('9', 'bold'): '\U0001D7D7',
+            ('9', 'bold_italic'): '\U0001D7D7',  # dígitos do negrito
+        }
+        for (text, style), expected in cases.items():
+            with self.subTest(text=text, style=style):
+                self.assertEqual(stylize(text, style), expected)
+
+    def test_reserved_codepoints(self):
+        # Letras que o Unicode já tinha no bloco Letterlike Symbols: os pontos
+        # de código correspondentes no bloco matemático estão reservados
+        cases = {
+            'italic': {'h': 'ℎ'},
+            'script': {'B': 'ℬ', 'E': 'ℰ', 'F': 'ℱ', 'H': 'ℋ', 'I': 'ℐ',
+                       'L': 'ℒ', 'M': 'ℳ', 'R': 'ℛ', 'e': 'ℯ', 'g': 'ℊ',
+                       'o': 'ℴ'},
+            'fraktur': {'C': 'ℭ', 'H': 'ℌ', 'I': 'ℑ', 'R': 'ℜ', 'Z': 'ℨ'},
+            'double_struck': {'C': 'ℂ', 'H': 'ℍ', 'N': 'ℕ', 'P': 'ℙ', 'Q': 'ℚ',
+                              'R': 'ℝ', 'Z': 'ℤ'},
+        }
+        for style, letters in cases.items():
+            for plain, expected in letters.items():
+                with self.subTest(style=style, letter=plain):
+                    self.assertEqual(stylize(plain, style), expected)
+
+    def test_neighbours_of_reserved_codepoints(self):
+        self.assertEqual(stylize('ghi', 'italic'), '\U0001D454ℎ\U0001D456')
+        self.assertEqual(stylize('ABC', 'script'), '\U0001D49Cℬ\U0001D49E')
+        self.assertEqual(stylize('BCD', 'fraktur'), '\U0001D505ℭ\U0001D507')
+        self.assertEqual(stylize('BCD', 'double_struck'), '\U0001D539ℂ\U0001D53B')
+
+    def test_other_characters_are_kept(self):
+        self.assertEqual(stylize('a-b é!', 'bold'), '\U0001D41A-\U0001D41B é!')
+
+
+if __name__ == '__main__':
+    unittest.main()